@@ -2,19 +2,32 @@
 
 # Import required libraries
 import random  # For generating random numbers
-import copy  # For creating deep copies of data structures
 import os  # For clearing the terminal screen
 import time  # For time-related functionalities
 import re  # For handling user input expressions
+import functools  # For caching results of repeated lookups
+import bisect  # For keeping ships sorted by size
 from difflib import SequenceMatcher
-from typing import List, Optional, Union, Dict, Tuple, Callable
-from icecream import ic
+from typing import List, Optional, Union, Dict, Tuple, Callable, NamedTuple
+try:
+    from icecream import ic  # Debug printing, only used while developing
+except ImportError:
+    def ic(*args):
+        """Stand-in for icecream.ic when it is not installed."""
+        return args[0] if len(args) == 1 else (args or None)
 import math
 import shutil
+import select
+import signal
+try:
+    import msvcrt  # Keyboard polling, only available on Windows
+except ImportError:
+    msvcrt = None
 from collections import defaultdict
 from collections import Counter
+from itertools import islice, zip_longest
+from operator import itemgetter
 import string
-from io import StringIO
 import sys
 
 start_time = time.time()  # tamer will start with game
@@ -30,6 +43,7 @@ DEFAULT_COLORS: Dict[str, str] = {
     "LightGray": "\u001b[37m",
     "Reset": "\u001b[0m",
 }
+COLOR_RESET = DEFAULT_COLORS["Reset"]
 
 # Unicode symbols used for visual representation of different ship statuses
 DEFAULT_SHIP_SYMBOLS: Dict[str, List[str]] = {
@@ -40,18 +54,24 @@ DEFAULT_SHIP_SYMBOLS: Dict[str, List[str]] = {
     "Miss": [chr(0x2022)]
 }
 
-DEFAULT_SHIPS = [
-    {"name": "AircraftCarrier", "size": 5, "qty": 1},
-    {"name": "Battleship", "size": 4, "qty": 1},
-    {"name": "Cruiser", "size": 3, "qty": 1},
-    {"name": "Submarine", "size": 3, "qty": 1},
-    {"name": "Destroyer", "size": 2, "qty": 2},
-    {"name": "Tug Boat", "size": 1, "qty": 4},
+class ShipSpec(NamedTuple):
+    """Configuration of one ship type: name, size and quantity."""
+    name: str
+    size: int
+    qty: int
 
-]
 
-# Game instructions and settings, presented as lists
-LIST_INSTRUCTIONS = [
+DEFAULT_SHIPS = (
+    ShipSpec("AircraftCarrier", 5, 1),
+    ShipSpec("Battleship", 4, 1),
+    ShipSpec("Cruiser", 3, 1),
+    ShipSpec("Submarine", 3, 1),
+    ShipSpec("Destroyer", 2, 2),
+    ShipSpec("Tug Boat", 1, 4),
+)
+
+# Game instructions and settings, presented as tuples of lines
+LIST_INSTRUCTIONS = (
     "1. Ships can be \u001b[34mHORIZONTAL\u001b[0m or \u001b["
     "32mVERTICAL\u001b[0m",
     "2. Ships can \u001b[31mNOT\u001b[0m be touching each other",
@@ -64,9 +84,9 @@ LIST_INSTRUCTIONS = [
     "0m",
     "",
     "To start game just press \u001b["
-    "33mENTER\u001b[0m"]
+    "33mENTER\u001b[0m")
 # Game settings adjustment text
-LIST_GAME_SETTINGS_CHANGES= [
+LIST_GAME_SETTINGS_CHANGES= (
     "To change game \u001b[33mFLEET\u001b[0m type \u001b[31mF\u001b[0m ",
     "If you want to change \u001b[33mMAP\u001b[0m type \u001b[31mM\u001b[0m ",
     "To change \u001b[33mCOORDINATES\u001b[0m  style type \u001b["
@@ -77,7 +97,72 @@ LIST_GAME_SETTINGS_CHANGES= [
     "    \u001b[33mmodify fleet\u001b[0m",
     "",
     "To return back type \u001b[31m0\u001b[0m - zero"
-]
+)
+
+# Settings menu texts, formatted with current values when shown
+TEXT_MAP_SIZE_SETTINGS = (
+    "Current game settings are set to:\n"
+    "\n"
+    "Map Dimensions:\n"
+    "\n"
+    "Height: {height}  Width: {width}\n"
+    "\n"
+    "If you would like to change it,\n"
+    "please type height and width\n"
+    "separated by comma")
+TEXT_COORDINATES_SETTINGS = (
+    "Current game Coordinate system is:\n"
+    "Row labels are {row_labels}\n"
+    "Columns are {column_labels}\n"
+    "\n"
+    "User input is {input_0} and {input_1}\n"
+    "\n"
+    "To change Labels type L\n"
+    "To change input style press I\n"
+    "To return back type 0")
+
+# Fleet menu texts, every line is one row of the table next to the map
+TEXT_FLEET_SELECT_SHIP = (
+    "To {action} ship type in ship name",
+    "Or type in ship index number:",
+    "Egzample 1 - {example}",
+    "Return to previous menu type - 0")
+TEXT_FLEET_ADD_SHIP = (
+    ("Type ship name, size and quantity",),
+    ("Egzample: Tugboat,1,4",),
+    ("To go back type 0",))
+
+# User command texts, for a command that was not understood and for a match
+TEXT_UNKNOWN_COMMAND = (
+    "I am sorry but i did not understand",
+    "what You wanted to say",
+    "",
+    "Please try following commands:",
+    "",
+    "modify fleet    print fleet",
+    "modify ship    add ship    delete ship",
+    "change map size    gaps between ships",
+    "change coordinate labels    change input",
+    "start game    reset settings")
+TEXT_COMMAND_MATCH = (
+    " You have entered: {user_input}\n"
+    "\n"
+    "I believe you wanted to say:\n"
+    "\n"
+    "    {user_command}\n"
+    "\n"
+    "If I am correct, just press ENTER\n"
+    "\n"
+    "type 0 to go back")
+
+# Pattern splitting user input into parts by any non-alphanumeric character
+INPUT_SPLIT_PATTERN = re.compile(r'[^A-Za-z0-9]+')
+
+# Escape codes clearing the terminal and its scrollback, as 'clear' does
+CLEAR_SCREEN_CODES = "\033[H\033[2J\033[3J"
+
+# Random deployment attempts before a fleet is considered not to fit a map
+DEPLOY_ATTEMPTS = 50
 
 # Commands dictionary
 # -------------------
@@ -106,6 +191,31 @@ DICTIONARY_COMMANDS = {
 # Helper Functions
 # ----------------
 
+# Terminal size is read when the game starts and refreshed only when the
+# window is resized, until then shutil's own fallback size is used
+TERMINAL_SIZE = os.terminal_size((80, 24))
+
+
+def update_terminal_size(*_):
+    """
+    Refresh TERMINAL_SIZE, used as the SIGWINCH (window resize) handler.
+    """
+    global TERMINAL_SIZE
+    TERMINAL_SIZE = shutil.get_terminal_size()
+
+
+def watch_terminal_size():
+    """
+    Read the terminal size and keep it up to date on window resizes.
+
+    Signal handlers can only be installed from the main thread, so this is
+    called when the game starts instead of at import.
+    """
+    update_terminal_size()
+    if hasattr(signal, "SIGWINCH"):  # Not available on Windows
+        signal.signal(signal.SIGWINCH, update_terminal_size)
+
+
 def clear_terminal():
     """
     Clear the terminal screen.
@@ -113,15 +223,80 @@ def clear_terminal():
     Windows systems.
     """
     if os.name == 'posix':  # Unix/Linux/macOS
-        os.system('clear')
+        # Same escape codes 'clear' writes, without starting a shell
+        print(CLEAR_SCREEN_CODES, end="", flush=True)
     elif os.name == 'nt':  # Windows
         os.system('cls')
 
 
+def input_pending():
+    """
+    Check if the player has already typed more input, e.g. pasted several
+    lines, so a menu can skip drawing a screen that is replaced right away.
+
+    Returns:
+        bool: True if stdin is a terminal with input waiting to be read.
+    """
+    try:
+        if not sys.stdin.isatty():
+            return False
+        if msvcrt is not None:  # Windows
+            return msvcrt.kbhit()
+        return bool(select.select([sys.stdin], [], [], 0)[0])
+    except (OSError, ValueError):
+        # stdin is closed or can not be polled
+        return False
+
+
+def print_screen(text, clear=False):
+    """
+    Print text to the terminal with a single write.
+
+    Args:
+        text (str): Text to print, lines separated by newlines.
+        clear (bool): Clear the terminal first. On POSIX the clear escape
+            codes are written together with the text, so the screen is
+            redrawn in one go.
+    """
+    if clear:
+        if os.name == 'posix':
+            text = CLEAR_SCREEN_CODES + text
+        else:
+            clear_terminal()
+    print(text, flush=True)
+
+
 # User Input Processing Functions
 # -------------------------------
 
 
+def validate_integer_parts(parts):
+    """
+    Validates already split user input parts as integers.
+
+    Parameters:
+        parts (Sequence[str]): Parts of the user input.
+
+    Returns:
+        tuple: Same as validate_user_input with type 'integer': validity
+            flag, tuple of parts converted to integers where possible, and
+            a list of messages for parts that are not integers.
+    """
+    input_valid = True
+    output_text = []
+    converted_parts = []
+    for part in parts:
+        # Check if the part is an integer
+        if not part.isdigit():
+            output_text.append(f'Your input "{part}" is NOT an Integer.')
+            input_valid = False
+            converted_parts.append(part)
+        else:
+            # Convert the part to an integer for future use
+            converted_parts.append(int(part))
+    return input_valid, tuple(converted_parts), output_text
+
+
 def validate_user_input(input_str, parts, type=None):
     """
     Validates user input by splitting it into a specified number of parts and
@@ -144,7 +319,7 @@ def validate_user_input(input_str, parts, type=None):
 
     # Use a regular expression to split the input into parts by any
     # non-alphanumeric character, removing any empty strings.
-    split_input = re.split(r'[^A-Za-z0-9]+', input_str)
+    split_input = INPUT_SPLIT_PATTERN.split(input_str)
     # Initialize a flag to keep track of whether the entire input is valid
     input_valid = True
 
@@ -160,14 +335,7 @@ def validate_user_input(input_str, parts, type=None):
 
     # If a specific data type is expected for each part, perform type validation
     if type == 'integer':
-        for i, part in enumerate(split_input):
-            # Check if the part is an integer
-            if not part.isdigit():
-                output_text.append(f'Your input "{part}" is NOT an Integer.')
-                input_valid = False
-            else:
-                # Convert the part to an integer for future use
-                split_input[i] = int(part)
+        return validate_integer_parts(split_input)
     elif type == 'alpha':
         for i, part in enumerate(split_input):
             # Check if the part is a single letter in the UK alphabet
@@ -217,8 +385,12 @@ def validate_values(value1, value2):
 
 
 # Define the normalization function
+# Inputs and command expressions repeat a lot, so results are cached and
+# interned, equal normalized strings are then the same object and compare
+# and hash as cheaply as possible in lookups
+@functools.lru_cache(maxsize=4096)
 def input_normalize_string(text_input):
-    return ' '.join(sorted(text_input.lower().split()))
+    return sys.intern(' '.join(sorted(text_input.lower().split())))
 
 # Define the function to find unique words
 def find_unique_words(command_dict):
@@ -226,42 +398,198 @@ def find_unique_words(command_dict):
     word_count = Counter(all_words)
     return {word for word, count in word_count.items() if count == 1}
 
+
+def command_dictionary_key(command_dict):
+    """
+    Create a hashable snapshot of a command dictionary, used as a cache key.
+
+    Parameters:
+        command_dict (dict): Command names mapped to lists of expressions.
+
+    Returns:
+        tuple: Tuple of (command, tuple of expressions) pairs.
+    """
+    return tuple((key, tuple(values)) for key, values in command_dict.items())
+
+
+@functools.lru_cache(maxsize=8)
+def find_unique_words_cached(dictionary_key):
+    """
+    Find unique words of a command dictionary, reusing earlier results.
+
+    Parameters:
+        dictionary_key (tuple): Snapshot made by command_dictionary_key.
+
+    Returns:
+        tuple: Words used only once across all command expressions, in the
+            order find_unique_words gives them.
+    """
+    return tuple(find_unique_words(dict(dictionary_key)))
+
+
+@functools.lru_cache(maxsize=8)
+def find_unique_word_commands_cached(dictionary_key):
+    """
+    Map every unique word of a command dictionary to its command, reusing
+    earlier results.
+
+    Parameters:
+        dictionary_key (tuple): Snapshot made by command_dictionary_key.
+
+    Returns:
+        dict: Unique word mapped to the first command with an expression
+            containing it. Words keep the order find_unique_words gives
+            them, so iterating the dictionary tries them in the same order
+            as scanning the unique words directly.
+    """
+    unique_words = find_unique_words_cached(dictionary_key)
+    unique_word_commands = {}
+    for unique_word in unique_words:
+        for key, values in dictionary_key:
+            if any(unique_word in value for value in values):
+                unique_word_commands[unique_word] = key
+                break
+    return unique_word_commands
+
+
+@functools.lru_cache(maxsize=8)
+def find_exact_matches_cached(dictionary_key):
+    """
+    Map normalized expressions to the name of their command, reusing
+    earlier results.
+
+    Parameters:
+        dictionary_key (tuple): Snapshot made by command_dictionary_key.
+
+    Returns:
+        dict: Normalized expression mapped to its command. If an expression
+            belongs to more commands, the first one is kept, as the fuzzy
+            match would keep it.
+    """
+    exact_matches = {}
+    for key, values in dictionary_key:
+        for value in values:
+            exact_matches.setdefault(input_normalize_string(value), key)
+    return exact_matches
+
+
+@functools.lru_cache(maxsize=8)
+def find_normalized_expressions_cached(dictionary_key):
+    """
+    List all expressions of a command dictionary in normalized form,
+    reusing earlier results.
+
+    Parameters:
+        dictionary_key (tuple): Snapshot made by command_dictionary_key.
+
+    Returns:
+        tuple: (command, normalized expression) pairs in dictionary order.
+    """
+    return tuple((key, input_normalize_string(value))
+                 for key, values in dictionary_key for value in values)
+
+
+# DICTIONARY_COMMANDS is constant, its snapshot is made once
+DICTIONARY_COMMANDS_KEY = command_dictionary_key(DICTIONARY_COMMANDS)
+
+
 # Define the main function to find the best match
 def find_best_match(user_input, command_dict):
+    """
+    Find the command from command_dict that best matches the user input.
+
+    Results are cached per normalized input and dictionary content, see
+    find_best_match_cached.
+
+    Parameters:
+        user_input (str): Text typed in by the user.
+        command_dict (dict): Command names mapped to lists of expressions.
+
+    Returns:
+        list or None: Matching command names, None if nothing matches.
+    """
     normalized_input = input_normalize_string(user_input)
-    unique_words = find_unique_words(command_dict)
+    if command_dict is DICTIONARY_COMMANDS:
+        dictionary_key = DICTIONARY_COMMANDS_KEY
+    else:
+        dictionary_key = command_dictionary_key(command_dict)
+    best_match = find_best_match_cached(normalized_input, dictionary_key)
+    return list(best_match) if best_match else None
+
+
+@functools.lru_cache(maxsize=1024)
+def find_best_match_cached(normalized_input, dictionary_key):
+    """
+    Find the best matching commands for an already normalized input.
+
+    Dictionaries are passed as snapshots made by command_dictionary_key, so
+    a changed fleet produces a new key and old results are never reused.
+
+    Parameters:
+        normalized_input (str): Input normalized by input_normalize_string.
+        dictionary_key (tuple): Snapshot made by command_dictionary_key.
+
+    Returns:
+        tuple or None: Matching command names, None if nothing matches.
+    """
+    unique_word_commands = find_unique_word_commands_cached(dictionary_key)
 
     # If the input is exactly one of the unique words, return the corresponding full command
-    if normalized_input in unique_words:
-        for key, values in command_dict.items():
-            for value in values:
-                if normalized_input in value:
-                    return [key]
+    unique_word_command = unique_word_commands.get(normalized_input)
+    if unique_word_command is not None:
+        return (unique_word_command,)
 
     # If the input matches a unique word in any of the commands, return that command
-    for unique_word in unique_words:
+    for unique_word, key in unique_word_commands.items():
         if unique_word in normalized_input:
-            for key, values in command_dict.items():
-                for value in values:
-                    if unique_word in value:
-                        return [key]
+            return (key,)
 
     # If the input is a substring of any of the commands, return those command keys
-    partial_matches = [key for key, values in command_dict.items() if any(normalized_input in command for command in values)]
+    partial_matches = tuple(key for key, values in dictionary_key if any(normalized_input in command for command in values))
     if partial_matches:
         return partial_matches
 
+    # If the input is exactly one of the expressions, it is its own closest
+    # match and there is nothing to guess
+    exact_match = find_exact_matches_cached(dictionary_key).get(
+        normalized_input)
+    if exact_match is not None:
+        return (exact_match,)
+
     # Otherwise, check for the closest match in the entire command dictionary
     max_ratio = 0
     best_match = None
-    for key, values in command_dict.items():
-        for command in values:
-            ratio = SequenceMatcher(None, normalized_input, input_normalize_string(command)).ratio()
-            if ratio > max_ratio:
-                max_ratio = ratio
-                best_match = key
+    for key, command in find_normalized_expressions_cached(dictionary_key):
+        matcher = SequenceMatcher(None, normalized_input, command)
+        # Quick ratios are upper bounds of ratio, skip commands that can not
+        # beat the best match found so far
+        if (matcher.real_quick_ratio() <= max_ratio or
+                matcher.quick_ratio() <= max_ratio):
+            continue
+        ratio = matcher.ratio()
+        if ratio > max_ratio:
+            max_ratio = ratio
+            best_match = key
+
+    return (best_match,) if best_match else None
+
 
-    return [best_match] if best_match else None
+@functools.lru_cache(maxsize=512)
+def find_best_command_match(user_input):
+    """
+    Find the best matching game command for the user input.
+
+    DICTIONARY_COMMANDS never changes while the game runs, so results are
+    cached and a repeated input is answered without matching it again.
+
+    Parameters:
+        user_input (str): Command typed in by the user.
+
+    Returns:
+        list or None: Same as find_best_match for DICTIONARY_COMMANDS. The
+            returned list is shared between calls and must not be modified.
+    """
+    return find_best_match(user_input, DICTIONARY_COMMANDS)
 
 
 def create_ship_dictionary_from_fleet(fleet):
@@ -277,14 +605,24 @@ def create_ship_dictionary_from_fleet(fleet):
     """
     ship_dictionary = {}
     for ship in fleet.ships:
-        name_variants = [
-            ship.name,                     # Original
-            ship.name.replace(" ", ""),    # Without spaces
-            ship.name.lower(),             # Lowercase
-            ship.name.replace(" ", "").lower() # Lowercase without spaces
-        ]
-        # Add all variants to the dictionary pointing to the original ship name
-        ship_dictionary[ship.name] = list(set(name_variants))  # Remove duplicates
+        name = ship.name
+        # Fleet can hold many ships with the same name, variants are the same
+        if name in ship_dictionary:
+            continue
+        nospace = name.replace(" ", "")    # Without spaces
+        lower = name.lower()               # Lowercase
+        nospace_lower = nospace.lower()    # Lowercase without spaces
+
+        # Add all variants to the dictionary pointing to the original ship
+        # name, skipping duplicates without building a set
+        name_variants = [name]
+        if nospace != name:
+            name_variants.append(nospace)
+        if lower != name:
+            name_variants.append(lower)
+        if nospace_lower not in (nospace, lower):
+            name_variants.append(nospace_lower)
+        ship_dictionary[name] = name_variants
     return ship_dictionary
 
 
@@ -302,6 +640,7 @@ class BattleshipGameInfo:
 
     Attributes:
         actions (list of dict): List of dictionaries storing details of each action.
+        latest_actions (dict): Latest action of each player type.
         timer (float): Time elapsed or remaining in the game.
 
     Methods:
@@ -316,7 +655,9 @@ class BattleshipGameInfo:
         Constructs all the necessary attributes for the BattleshipGameInfo object.
         """
         self.actions = []  # List to store actions
+        self.latest_actions = {}  # Latest action for each player type
         self.timer = 0.0
+        self.timer_start = None  # None while the timer is not running
 
     def update_action(self, player_type, row, column, outcome):
         """
@@ -335,6 +676,7 @@ class BattleshipGameInfo:
             "outcome": outcome
         }
         self.actions.append(action)
+        self.latest_actions[player_type] = action
 
     def get_latest_action_by_player_type(self, player_type):
         """
@@ -347,26 +689,26 @@ class BattleshipGameInfo:
             str: A formatted string containing the details of the latest action for the specified player type.
                  Returns a message if no action has been recorded for the player type.
         """
-        for action in reversed(self.actions):
-            if action['player_type'] == player_type:
-                return (f"Time: {self.timer:.2f} seconds, "
-                        f"Player Type: {action['player_type']}, "
-                        f"Row: {action['row']}, Column: {action['column']}, "
-                        f"Outcome: {action['outcome']}")
-        return "No action has been recorded for this player type."
+        action = self.latest_actions.get(player_type)
+        if action is None:
+            return "No action has been recorded for this player type."
+        return (f"Time: {self.timer:.2f} seconds, "
+                f"Player Type: {action['player_type']}, "
+                f"Row: {action['row']}, Column: {action['column']}, "
+                f"Outcome: {action['outcome']}")
 
     def start_timer(self):
         """
         Starts the game timer.
         """
-        self.timer_start = time.time()
+        self.timer_start = time.perf_counter()
 
     def update_timer(self):
         """
         Updates the timer with the elapsed time since the timer was started.
         """
-        if hasattr(self, 'timer_start'):
-            self.timer = time.time() - self.timer_start
+        if self.timer_start is not None:
+            self.timer = time.perf_counter() - self.timer_start
         else:
             print("Timer has not been started.")
 
@@ -375,8 +717,7 @@ class BattleshipGameInfo:
         Stops the timer and updates the timer attribute with the total time elapsed.
         """
         self.update_timer()
-        if hasattr(self, 'timer_start'):
-            del self.timer_start
+        self.timer_start = None
 
     def reset_game(self):
         """
@@ -384,9 +725,9 @@ class BattleshipGameInfo:
         This includes clearing the action logs and resetting the timer.
         """
         self.actions = []
+        self.latest_actions = {}
         self.timer = 0.0
-        if hasattr(self, 'timer_start'):
-            del self.timer_start
+        self.timer_start = None
 
     def __str__(self):
         """
@@ -401,6 +742,24 @@ class BattleshipGameInfo:
         return (f"Timer: {self.timer:.2f} seconds\nActions:\n{actions_str}")
 
 
+# Letter labels for rows and columns
+ALPHABET_LABELS = tuple(string.ascii_uppercase)
+
+
+@functools.lru_cache(maxsize=64)
+def generate_integer_labels(length):
+    """
+    Generate integer labels for a map side, reusing earlier results.
+
+    Args:
+        length (int): The length of the map side.
+
+    Returns:
+        tuple: Integer labels from 0 to length.
+    """
+    return tuple(range(0, length + 1))
+
+
 class game_settings:
     """Class to hold default map settings for the Battleship game.
 
@@ -415,8 +774,16 @@ class game_settings:
         column_label_symbol (str or int): Symbol used for column labels.
         row_labels (list): List of row index labels.
         col_labels (list): List of column index labels.
+        row_first (bool): Whether input style has the row first.
     """
 
+    # Settings are read on every menu redraw, slots make attribute access
+    # faster and instances smaller
+    __slots__ = ('_height', '_width', 'symbol', 'gaps', 'maps_gap',
+                 '_input_style', 'row_first', 'row_label_symbol',
+                 'column_label_symbol', 'row_labels', 'col_labels',
+                 '_row_label_width_key', '_row_label_width_cached')
+
     def __init__(self,
                  height=10,
                  width=10,
@@ -443,13 +810,32 @@ class game_settings:
         self.symbol = symbol
         self.gaps = gaps
         self.maps_gap = maps_gap
-        self.input_style = input_style.copy()  # Create a copy to avoid reference issues
+        self.input_style = input_style  # Setter copies, avoids reference issues
         self.row_label_symbol = row_label_symbol
         self.column_label_symbol = column_label_symbol
         self.row_labels = []
         self.col_labels = []
+        self._row_label_width_key = None
+        self._row_label_width_cached = 0
         self.update_labels()
 
+    def row_label_width(self):
+        """
+        Return the length of the longest row label shown on the map.
+
+        The value only depends on the row label symbol and the map height,
+        so it is cached and recalculated only when one of those changes.
+
+        Returns:
+            int: Maximum length of the row index labels.
+        """
+        key = (self.row_label_symbol, self._height)
+        if self._row_label_width_key != key:
+            self._row_label_width_cached = find_max_label_length(
+                self._height, self.row_labels)
+            self._row_label_width_key = key
+        return self._row_label_width_cached
+
     def update_labels(self):
         """Update row_labels and col_labels based on current settings."""
         self.row_labels = self.generate_labels(self.row_label_symbol, self._height)
@@ -467,9 +853,21 @@ class game_settings:
             list: Generated labels.
         """
         if str(symbol).isdigit():
-            return list(range(0, length + 1))
+            return list(generate_integer_labels(length))
         else:
-            return list(string.ascii_uppercase)[:length]
+            return list(ALPHABET_LABELS[:length])
+
+    @property
+    def input_style(self):
+        return self._input_style
+
+    @input_style.setter
+    def input_style(self, value):
+        self._input_style = value.copy()
+        # Whether the player types the row first, kept in sync with the
+        # style so menus do not compare strings on every redraw
+        self.row_first = (self._input_style[0] == "Row" and
+                          self._input_style[1] == "Column")
 
     @property
     def height(self):
@@ -489,6 +887,27 @@ class game_settings:
         self._width = value
         self.update_labels()
 
+    def format_coordinates(self, coordinates):
+        """
+        Format map coordinates with the current labels and input style.
+
+        Args:
+            coordinates (List[Tuple[int, int]]): (row, column) pairs.
+
+        Returns:
+            List[str]: Coordinates as labels, e.g. 'A,1', ordered the same
+            way the player types them in.
+        """
+        row_first = self.row_first
+        formatted = []
+        for row, column in coordinates:
+            row_label, col_label = self.row_labels[row], self.col_labels[column]
+            if row_first:
+                formatted.append(f"{row_label},{col_label}")
+            else:
+                formatted.append(f"{col_label},{row_label}")
+        return formatted
+
     def __str__(self):
         """
         Return a string representation of the current settings.
@@ -546,6 +965,8 @@ class Ship:
             size (int): The size of the ship in cells.
             cell_coordinates (List[Tuple[int, int]]): Coordinates (x, y) for
                 each cell of the ship.
+            cell_coordinates_set (Set[Tuple[int, int]]): The same
+                coordinates as a set, for fast lookups.
             sunk (bool): Indicates whether the ship is sunk or not.
             color (str): ANSI color code for the ship, based on its status.
             alignment (str): alignment of the ship ("Horizontal" or
@@ -554,10 +975,15 @@ class Ship:
         self.name = name
         self.size = size
         self.cell_coordinates = []
+        self.cell_coordinates_set = set()
         self.sunk = False
         self.color = None
         self.alignment = None
         self.deployed = False
+        self._symbols_key = None
+        self._symbols_cache = ()
+        self._formatted_coordinates_key = None
+        self._formatted_coordinates_cache = ""
 
         # Setting initial color and alignment based on ship size
         if self.size == 1:
@@ -569,9 +995,67 @@ class Ship:
         Set the coordinates for each cell of the ship.
 
         Parameters: coordinates (List[List[int, int]]): A list of (x,
-            y) tuples representing the coordinates for each cell.
+            y) pairs representing the coordinates for each cell. Pairs are
+            stored as tuples.
+        """
+        # Coordinates are stored as (row, column) tuples, which are smaller
+        # than lists and can be used directly as set members
+        self.cell_coordinates = [(row, column) for row, column in coordinates]
+        # Set of (row, column) tuples for constant time membership checks
+        self.cell_coordinates_set = set(self.cell_coordinates)
+        # Formatted coordinates have to be made again
+        self._formatted_coordinates_key = None
+
+    def get_formatted_coordinates(self, game_settings):
+        """
+        Get the ship coordinates formatted for the fleet table.
+
+        Coordinates only change when the ship is deployed, so the string is
+        cached and made again only when they or the label settings change.
+
+        Parameters:
+            game_settings (game_settings): Settings holding map labels and
+            input style.
+
+        Returns:
+            str: Formatted coordinates of all ship cells.
+        """
+        if self.formatted_coordinates_stale(game_settings):
+            self.set_formatted_coordinates(
+                game_settings,
+                game_settings.format_coordinates(self.cell_coordinates))
+        return self._formatted_coordinates_cache
+
+    def formatted_coordinates_stale(self, game_settings):
+        """
+        Check if the cached formatted coordinates have to be made again.
+
+        Parameters:
+            game_settings (game_settings): Settings holding map labels and
+            input style.
+
+        Returns:
+            bool: True if there is no valid cached string for the settings.
+        """
+        return self._formatted_coordinates_key != (
+            game_settings.row_label_symbol,
+            game_settings.column_label_symbol,
+            tuple(game_settings.input_style))
+
+    def set_formatted_coordinates(self, game_settings, formatted):
         """
-        self.cell_coordinates = coordinates
+        Store already formatted coordinates of all ship cells in the cache.
+
+        Parameters:
+            game_settings (game_settings): Settings the coordinates were
+            formatted with.
+            formatted (List[str]): One formatted coordinate per ship cell.
+        """
+        self._formatted_coordinates_cache = " ".join(formatted)
+        self._formatted_coordinates_key = (
+            game_settings.row_label_symbol,
+            game_settings.column_label_symbol,
+            tuple(game_settings.input_style))
 
     def get_coordinates_by_single_coordinate(self, single_coordinate):
         """
@@ -593,7 +1077,7 @@ class Ship:
         associated with the ship.
         """
         coordinates_list = []
-        if single_coordinate in self.cell_coordinates:
+        if tuple(single_coordinate) in self.cell_coordinates_set:
             coordinates_list = self.cell_coordinates
         return coordinates_list
 
@@ -627,6 +1111,22 @@ class Ship:
         self.sunk = True
         self.color = DEFAULT_COLORS["DarkRed"]
 
+    def clone(self):
+        """
+        Create a copy of the ship with the same status and coordinates.
+
+        Returns:
+            Ship: A new Ship object with the same attributes.
+        """
+        new_ship = Ship(self.name, self.size)
+        new_ship.cell_coordinates = self.cell_coordinates.copy()
+        new_ship.cell_coordinates_set = self.cell_coordinates_set.copy()
+        new_ship.sunk = self.sunk
+        new_ship.color = self.color
+        new_ship.alignment = self.alignment
+        new_ship.deployed = self.deployed
+        return new_ship
+
     def get_symbols(self):
         """
         Get symbols for all ship cells based on its hit status and alignment.
@@ -646,6 +1146,22 @@ class Ship:
             The color of each symbol will be red if the ship is sunk.
             Warnings will be printed to the console if the color or symbols
             are not defined.
+            Symbols only depend on size, alignment, color and sunk status,
+            so they are cached and rebuilt only when one of those changes.
+        """
+
+        key = (self.size, self.alignment, self.color, self.sunk)
+        if self._symbols_key != key:
+            self._symbols_cache = tuple(self._build_symbols())
+            self._symbols_key = key
+        return list(self._symbols_cache)
+
+    def _build_symbols(self):
+        """
+        Build colored symbols for all ship cells, used by get_symbols.
+
+        Returns:
+            List[str]: A list of colored symbols for all cells of the ship.
         """
 
         # Determine the color based on sunk status
@@ -667,16 +1183,15 @@ class Ship:
             print("Warning: symbols list is empty. Using default.")
             symbols = ["default_symbol"]
 
-        # Initialize colored_symbols as an empty list
-        colored_symbols = []
-
-        # Generate colored symbols based on ship size and status
-        for i in range(self.size):
-            # Choose the appropriate symbol based on position
-            symbol = symbols[0] if i == 0 else symbols[1]
+        if self.size < 1:
+            return []
 
-            # Color the symbol and append to the list
-            colored_symbols.append(color + symbol + DEFAULT_COLORS["Reset"])
+        # First cell uses the first symbol, all other cells the second one,
+        # so only two colored symbols have to be made
+        colored_symbols = [color + symbols[0] + COLOR_RESET]
+        if self.size > 1:
+            colored_symbols += [color + symbols[1] + COLOR_RESET] * (
+                    self.size - 1)
         return colored_symbols
 
 
@@ -691,8 +1206,26 @@ class Fleet:
         Initialize an empty Fleet object.
         Variables:
             ships (List[Ship]): A list to store the Ship objects that belong to this fleet.
+            ships_by_name (Dict[str, List[Ship]]): The same ships grouped
+                by name, for lookups without scanning the whole fleet.
+            ships_by_size (List[Ship]): The same ships sorted by size,
+                biggest first, ships of equal size in the order added.
+            version (int): Increased every time ships are added or removed,
+                so results built from the fleet know when to rebuild.
         """
         self.ships = []
+        self.ships_by_name = defaultdict(list)
+        self.ships_by_size = []
+        # Negated sizes of ships_by_size, bisect searches them to keep the
+        # ships sorted biggest first
+        self._ship_size_keys = []
+        self.version = 0
+        # Ship dictionary and the fleet version it was built for
+        self._ship_dictionary_version = None
+        self._ship_dictionary = None
+        # Signature and the fleet version it was built for
+        self._signature_version = None
+        self._signature = None
 
     def add_ship(self, ship):
         """
@@ -701,6 +1234,24 @@ class Fleet:
             ship (Ship): The Ship object to be added to the fleet.
         """
         self.ships.append(ship)
+        self.ships_by_name[ship.name].append(ship)
+        # Ships of equal size keep the order they were added in
+        index = bisect.bisect_right(self._ship_size_keys, -ship.size)
+        self._ship_size_keys.insert(index, -ship.size)
+        self.ships_by_size.insert(index, ship)
+        self.version += 1
+
+    def clone(self):
+        """
+        Create a copy of the fleet, every ship is cloned with its status.
+
+        Returns:
+            Fleet: A new Fleet object with copies of all ships.
+        """
+        new_fleet = Fleet()
+        for ship in self.ships:
+            new_fleet.add_ship(ship.clone())
+        return new_fleet
 
     def remove_ships_by_name(self, name):
         """
@@ -712,10 +1263,36 @@ class Fleet:
         Returns:
             int: The number of ships that were removed.
         """
-        initial_ship_count = len(self.ships)
-        self.ships = [ship for ship in self.ships if ship.name != name]
-        removed_ship_count = initial_ship_count - len(self.ships)
-        return removed_ship_count
+        removed_ships = self.ships_by_name.pop(name, [])
+        if removed_ships:
+            self.ships = [ship for ship in self.ships if ship.name != name]
+            self.ships_by_size = [ship for ship in self.ships_by_size
+                                  if ship.name != name]
+            self._ship_size_keys = [-ship.size for ship in self.ships_by_size]
+            self.version += 1
+        return len(removed_ships)
+
+    def ship_dictionary(self):
+        """
+        Get the ship name dictionary of the fleet, see
+        create_ship_dictionary_from_fleet. It is only built again after
+        ships were added or removed.
+
+        Returns:
+            dict: Ship names mapped to their name variants.
+        """
+        if self._ship_dictionary_version != self.version:
+            self._ship_dictionary = create_ship_dictionary_from_fleet(self)
+            self._ship_dictionary_version = self.version
+        return self._ship_dictionary
+
+    def clear_deployment(self):
+        """
+        Mark all ships as not deployed, so the fleet can be deployed again
+        after a failed attempt.
+        """
+        for ship in self.ships:
+            ship.deployed = False
 
     def get_ship(self, name, is_deployed=False):
         """
@@ -726,8 +1303,8 @@ class Fleet:
         Returns:
             Ship or None: The Ship object if found; None if not found.
         """
-        for ship in self.ships:
-            if ship.name == name and ship.deployed == is_deployed:
+        for ship in self.ships_by_name.get(name, ()):
+            if ship.deployed == is_deployed:
                 return ship
         return None
 
@@ -743,10 +1320,9 @@ class Fleet:
             int: The number of ships of the specified type and status.
         """
         return sum(
-            ship.name == name and
             (is_sunk is None or ship.sunk == is_sunk) and
             (is_deployed is None or ship.deployed == is_deployed)
-            for ship in self.ships
+            for ship in self.ships_by_name.get(name, ())
         )
 
     def get_biggest_ship_by_deployed_status(self, is_deployed=False):
@@ -757,10 +1333,11 @@ class Fleet:
         Returns:
             Ship or None: The biggest ship object if found; None otherwise.
         """
-        return max(
-            (ship for ship in self.ships if ship.deployed == is_deployed),
-            key=lambda x: x.size,
-            default=None
+        # Ships are sorted by size, the first one with the status is biggest
+        return next(
+            (ship for ship in self.ships_by_size
+             if ship.deployed == is_deployed),
+            None
         )
 
     def get_biggest_ship_by_sunk_status(self, is_sunk=False):
@@ -772,10 +1349,10 @@ class Fleet:
         Returns:
             Ship or None: The biggest ship object if found; None otherwise.
         """
-        return max(
-            (ship for ship in self.ships if ship.sunk == is_sunk),
-            key=lambda x: x.size,
-            default=None
+        # Ships are sorted by size, the first one with the status is biggest
+        return next(
+            (ship for ship in self.ships_by_size if ship.sunk == is_sunk),
+            None
         )
 
     def __str__(self):
@@ -792,6 +1369,22 @@ class Fleet:
             for i, ship in enumerate(self.ships)
         )
 
+    def signature(self):
+        """
+        Describe the fleet composition independent of ship status.
+        It is only built again after ships were added or removed.
+        Returns:
+            Tuple[Tuple[str, int, int], ...]: Sorted (name, size, quantity)
+            of every ship type, equal for fleets with the same ships.
+        """
+        if self._signature_version != self.version:
+            quantities = Counter((ship.name, ship.size)
+                                 for ship in self.ships)
+            self._signature = tuple(sorted(
+                (name, size, qty) for (name, size), qty in quantities.items()))
+            self._signature_version = self.version
+        return self._signature
+
     def gather_basic_info(self):
         """
         Gather basic information about each ship in the fleet and sort by size.
@@ -827,6 +1420,10 @@ class Fleet:
                 self.add_quantity_condition(ship_info_list, 'sunk')
             elif 'coordinates' in condition:
                 self.add_coordinates_condition(ship_info_list, condition, game_settings)
+            else:
+                # Unknown conditions are shown as empty cells
+                for info in ship_info_list:
+                    info[condition] = ''
 
     def add_quantity_condition(self, ship_info_list, status_type):
         """
@@ -835,12 +1432,11 @@ class Fleet:
             ship_info_list (List[dict]): The list containing ship information.
             status_type (str): The status type to filter by ('deployed' or 'sunk').
         """
+        # Tally every ship name with the status in one pass over the fleet
+        quantities = Counter(ship.name for ship in self.ships
+                             if getattr(ship, status_type))
         for info in ship_info_list:
-            info[f"{status_type}_qty"] = self.get_ship_quantity(
-                name=info['name'],
-                is_sunk=True if status_type == 'sunk' else None,
-                is_deployed=True if status_type == 'deployed' else None
-            )
+            info[f"{status_type}_qty"] = quantities[info['name']]
 
     def add_coordinates_condition(self, ship_info_list, condition, game_settings):
         """
@@ -851,24 +1447,42 @@ class Fleet:
             game_settings (GameSettings): The game's coordinate style.
         """
         status_type = condition.replace('_coordinates', '')
+        ships_per_info = []
         for info in ship_info_list:
-            ships = [ship for ship in self.ships if ship.name == info['name']]
+            # Ships are already grouped by name in the fleet index
+            ships = self.ships_by_name.get(info['name'], ())
             if status_type:
                 ships = [ship for ship in ships if getattr(ship, status_type)]
-            coordinates = [ship.cell_coordinates for ship in ships]
-            info[condition] = self.format_coordinates(coordinates, game_settings)
+            ships_per_info.append((info, ships))
+
+        # Coordinates of all ships without a valid cache are formatted in
+        # one call and handed back to each ship
+        stale_ships = [ship for _, ships in ships_per_info for ship in ships
+                       if ship.formatted_coordinates_stale(game_settings)]
+        if stale_ships:
+            formatted = self.format_coordinates(
+                [coordinate for ship in stale_ships
+                 for coordinate in ship.cell_coordinates], game_settings)
+            start = 0
+            for ship in stale_ships:
+                end = start + len(ship.cell_coordinates)
+                ship.set_formatted_coordinates(game_settings,
+                                               formatted[start:end])
+                start = end
+
+        for info, ships in ships_per_info:
+            info[condition] = [ship.get_formatted_coordinates(game_settings)
+                               for ship in ships]
 
     def format_coordinates(self, coordinates, game_settings):
         """
         Format the coordinates according to the game's coordinate style.
         Parameters:
-            coordinates (List[tuple]): List of coordinates.
+            coordinates (List[tuple]): List of (row, column) coordinates.
             game_settings (GameSettings): The game's map settings.
         Returns:
             List[str]: List of formatted coordinates.
         """
-        # Implement coordinate formatting based on game settings.
-        # This code assumes that 'game_settings' provides the necessary properties and methods.
         return game_settings.format_coordinates(coordinates)
 
     def fleet_to_table(self, game_settings, conditions):
@@ -895,11 +1509,10 @@ class Fleet:
         """
         header = ["Name", "Size", "Qty"]
         header.extend(condition.replace('_', ' ').title() for condition in conditions)
+        # All columns of a row are fetched with one itemgetter call
+        get_row = itemgetter('name', 'size', 'qty', *conditions)
         table = [header]
-        for info in ship_info_list:
-            row = [info['name'], info['size'], info['qty']]
-            row.extend(info.get(condition, '') for condition in conditions)
-            table.append(row)
+        table.extend(list(get_row(info)) for info in ship_info_list)
         return table
 
 
@@ -949,7 +1562,7 @@ def create_fleet(fleet=None) -> Fleet:
     if fleet:
         # Extract the configuration from the existing fleet
         for ship in fleet.ships:
-            fleet_config.append({"name": ship.name, "size": ship.size, "qty": 1})
+            fleet_config.append(ShipSpec(ship.name, ship.size, 1))
     else:
         # Use the default configuration
         fleet_config = DEFAULT_SHIPS
@@ -958,8 +1571,8 @@ def create_fleet(fleet=None) -> Fleet:
 
     # Create Ship objects based on the provided or default configuration
     for ship_info in fleet_config:
-        for _ in range(ship_info["qty"]):
-            ship = Ship(ship_info["name"], ship_info["size"])
+        for _ in range(ship_info.qty):
+            ship = Ship(ship_info.name, ship_info.size)
             new_fleet.add_ship(ship)
 
     return new_fleet
@@ -987,9 +1600,32 @@ def create_map(height, width, symbol):
     This function performs two key tasks: 1. Creates a 2D list (map) with
     dimensions specified by `height` and `width`. 2. Fill each cell in the
     2D list with the default `symbol`.
+
+    Note:
+        Cells hold colored ship symbols (ANSI codes included), so they stay
+        strings. Each row is built with list repetition, all cells share the
+        same immutable `symbol` object.
+    """
+
+    return [[symbol] * width for _ in range(height)]
+
+
+def map_clear(map_game, symbol):
     """
+    Fill every cell of an existing map with the default symbol again, the
+    rows are reused instead of allocating a new map.
+
+    Parameters:
+        map_game (List[List[str]]): The 2D game map to clear.
+        symbol (str): The default symbol to fill each cell of the map with.
 
-    return [[symbol for _ in range(width)] for _ in range(height)]
+    Returns:
+        List[List[str]]: The same map, cleared.
+    """
+    blank_row = [symbol] * len(map_game[0])
+    for row in map_game:
+        row[:] = blank_row
+    return map_game
 
 
 def find_max_label_length(map_size, index_label):
@@ -1019,150 +1655,206 @@ def find_max_label_length(map_size, index_label):
     return max_length
 
 
-def print_two_maps(map_left, map_right, label_left, label_right,
-                   row_index_label, column_index_label, gap=10):
+@functools.lru_cache(maxsize=16)
+def map_layout(height, width, row_index_label, column_index_label):
     """
-    Print two 2D maps side-by-side with dynamically centered labels and a
-    customizable gap.
+    Build the parts of a printed map that only depend on its shape and
+    labels, shared by all map printing functions.
+
+    Board shape and labels stay the same for a whole game, so the layout is
+    cached and only the map values are rendered for every frame.
 
     Args:
-        map_left : A 2D list representing the first map.
-        map_right: A 2D list representing the second map.
-        label_left: Label for the first map.
-        label_right: Label for the second map.
-        row_index_label: Label indicating row index of the map
-        column_index_label: Label indicating column index of the map
+        height: Number of map rows.
+        width: Number of map columns.
+        row_index_label, column_index_label: Labels as tuples, so they can
+            be part of the cache key.
 
-        gap: Number of blank spaces between the two maps. Default is 10.
+    Returns:
+        Tuple[str, str, str, Tuple[str, ...], str, int]: Left offset,
+        column header line, separator line, row label prefixes, padding put
+        before every map value and the width of the map cells.
     """
 
     # Constants for character dimensions and formatting
     char_width = len("X")
 
-
     # Calculate the maximum number of digits in row and column indexes
-    num_digits_map_width = find_max_label_length(len(map_left[0]),
-                                                 column_index_label)
-    num_digits_map_height = find_max_label_length(len(map_left),
-                                                  row_index_label)
-
-    # Create a string of blank spaces for the gap between maps
-    gap_str = ' ' * gap
+    num_digits_map_width = find_max_label_length(width, column_index_label)
+    num_digits_map_height = find_max_label_length(height, row_index_label)
 
     # Calculate the left-side offset for aligning map and row indexes
     row_index_separator = " | "
     print_map_left_offset = " " * (
             num_digits_map_height + len(row_index_separator))
 
-    # Center-align the labels for both maps
-    number_char_table_total = len(map_left[0]) * (
-            num_digits_map_width + char_width + 1)
-    label_left_centered = label_left.center(number_char_table_total)
-    label_right_centered = label_right.center(number_char_table_total)
+    # Width every printed cell is aligned to, the same for all cells
+    cell_width = num_digits_map_width + char_width
+    number_char_table_total = width * (cell_width + 1)
 
-    # Print the centered labels for both maps
-    print(f"{print_map_left_offset}{label_left_centered}{gap_str}"
-          f"{print_map_left_offset}{label_right_centered}")
-
-    # Print column headers for both maps
-    print(print_map_left_offset, end=" ")
-    for col_index in range(len(map_left[0])):
-        print(str(column_index_label[col_index]).rjust(num_digits_map_width +
-                                                       char_width), end=" ")
-    print(gap_str, print_map_left_offset, end="")
-    for col_index in range(len(map_right[0])):
-        print(str(column_index_label[col_index]).rjust(
-            num_digits_map_width + char_width), end=" ")
-    print("")
-
-    # Print the horizontal separator line
-    separator_length_left = len(map_left[0]) * (
-            num_digits_map_width + char_width + 1)
-    separator_length_right = len(map_right[0]) * (
-            num_digits_map_width + char_width + 1)
-    print(print_map_left_offset + "=" * separator_length_left, end=gap_str)
-    print(" " + print_map_left_offset + "=" * separator_length_right)
-
-    # Loop through each row to print map values
-    for row_index, (row_left, row_right) in enumerate(
-            zip(map_left, map_right)):
-        print(str(row_index_label[row_index]).rjust(num_digits_map_height + 1),
-              end=row_index_separator)
-        for value in row_left:
-            width = len(str(value))
-            print(str(value).rjust(
-                num_digits_map_width + char_width - (char_width - width)),
-                end=" ")
-        print(gap_str, end="")
-        print(str(row_index_label[row_index]).rjust(num_digits_map_height + 1),
-              end=row_index_separator)
-        for value in row_right:
-            width = len(str(value))
-            print(str(value).rjust(
-                num_digits_map_width + char_width - (char_width - width)),
-                end=" ")
-        print()
+    # Padding by length, labels never exceed 'num_digits_map_width'. Map
+    # values are padded to 'num_digits_map_width' plus their own length,
+    # so they always get the same padding, whatever their (colored) length
+    pads = [" " * i for i in range(cell_width + 1)]
+    cell_pad = pads[num_digits_map_width]
 
+    # Column headers and the horizontal separator line
+    header_line = print_map_left_offset + " " + "".join(
+        pads[cell_width - len(label)] + label + " "
+        for label in map(str, column_index_label[:width]))
+    separator_line = print_map_left_offset + "=" * number_char_table_total
 
-def print_map_and_list(map_left, list_text, label_left, label_instructions,
-                       row_index_label, column_index_label, gap=10):
+    # Row index labels with their separator, one per map row
+    row_prefixes = tuple(
+        str(row_index_label[row_index]).rjust(num_digits_map_height + 1) +
+        row_index_separator for row_index in range(height))
+
+    return (print_map_left_offset, header_line, separator_line,
+            row_prefixes, cell_pad, number_char_table_total)
+
+
+def render_map_rows(map_game, row_prefixes, cell_pad):
     """
-    Print a 2D map on the left and a list of instructions on the right with
-    dynamically centered labels and a customizable gap.
+    Render map rows as text, each value behind the same padding.
 
     Args:
-        map_left: A 2D list representing the map.
-        list_text: A list of strings representing the instructions.
-        label_left: Label for the map.
-        label_instructions: Label for the instructions.
-        game_settings: Game map settings including row and column index
-        labels.
-        gap: Number of blank spaces between the map and instructions.
-        Default is 10.
+        map_game: A 2D list representing the map.
+        row_prefixes: Row label prefixes from map_layout.
+        cell_pad: Padding before every value, from map_layout.
+
+    Returns:
+        List[str]: One line per map row.
     """
-    char_width = len("X")
+    # Every value but the first is preceded by the space closing the
+    # previous one and its own padding, so a row is joined in one call
+    separator = " " + cell_pad
+    return [f"{row_label}{cell_pad}{separator.join(map(str, row))} "
+            for row_label, row in zip(row_prefixes, map_game)]
 
-    num_digits_map_width = find_max_label_length(len(map_left[0]),
-                                                 column_index_label)
-    num_digits_map_height = find_max_label_length(len(map_left),
-                                                  row_index_label)
-    gap_str = ' ' * gap
-    row_index_separator = " | "
-    print_map_left_offset = " " * (
-            num_digits_map_height + len(row_index_separator))
-    number_char_table_total = len(map_left[0]) * (
-            num_digits_map_width + char_width + 1)
-    label_left_centered = label_left.center(number_char_table_total)
-    print(f"{print_map_left_offset}{label_left_centered}{gap_str}"
-          f"{print_map_left_offset}{label_instructions.center(40)}")
-    print(print_map_left_offset, end=" ")
-    for col_index in range(len(map_left[0])):
-        print(str(column_index_label[col_index]).rjust(
-            num_digits_map_width + char_width), end=" ")
-    print(gap_str)
-    separator_length_left = len(map_left[0]) * (
-            num_digits_map_width + char_width + 1)
-    print(print_map_left_offset + "=" * separator_length_left, end=gap_str)
-    print("")
-    for row_index, row_left in enumerate(map_left):
-        print(str(row_index_label[row_index]).rjust(num_digits_map_height + 1),
-              end=row_index_separator)
-        for value in row_left:
-            width = len(str(value))
-            print(str(value).rjust(
-                num_digits_map_width + char_width - (char_width - width)),
-                end=" ")
-        print(gap_str, end="")
-        instruction = list_text[row_index] if row_index < len(
+
+@functools.lru_cache(maxsize=16)
+def two_maps_layout(height, width_left, width_right, label_left,
+                    label_right, row_index_label, column_index_label, gap):
+    """
+    Build the header lines of the two maps frame, used by print_two_maps.
+
+    Args:
+        height: Number of map rows.
+        width_left, width_right: Number of columns of both maps.
+        label_left, label_right, gap: Same as for print_two_maps.
+        row_index_label, column_index_label: Labels as tuples, so they can
+            be part of the cache key.
+
+    Returns:
+        Tuple[Tuple[str, ...], Tuple[str, ...], str, str]: Header lines
+        (labels, column headers, separator), row label prefixes, padding
+        put before every map value and the gap between maps.
+    """
+    (print_map_left_offset, header_left, separator_left, row_prefixes,
+     cell_pad, number_char_table_total) = map_layout(
+        height, width_left, row_index_label, column_index_label)
+    _, header_right, separator_right, _, _, _ = map_layout(
+        height, width_right, row_index_label, column_index_label)
+
+    # Create a string of blank spaces for the gap between maps
+    gap_str = ' ' * gap
+
+    # Center-align the labels for both maps
+    label_left_centered = label_left.center(number_char_table_total)
+    label_right_centered = label_right.center(number_char_table_total)
+    labels_line = (f"{print_map_left_offset}{label_left_centered}{gap_str}"
+                   f"{print_map_left_offset}{label_right_centered}")
+
+    return ((labels_line,
+             f"{header_left}{gap_str}{header_right}",
+             f"{separator_left}{gap_str} {separator_right}"),
+            row_prefixes, cell_pad, gap_str)
+
+
+def print_two_maps(map_left, map_right, label_left, label_right,
+                   row_index_label, column_index_label, gap=10, clear=False):
+    """
+    Print two 2D maps side-by-side with dynamically centered labels and a
+    customizable gap.
+
+    Args:
+        map_left : A 2D list representing the first map.
+        map_right: A 2D list representing the second map.
+        label_left: Label for the first map.
+        label_right: Label for the second map.
+        row_index_label: Label indicating row index of the map
+        column_index_label: Label indicating column index of the map
+
+        gap: Number of blank spaces between the two maps. Default is 10.
+        clear: Clear the terminal in the same write. Default is False.
+    """
+
+    # Everything except the map values comes from the cached layout
+    header_lines, row_prefixes, cell_pad, gap_str = two_maps_layout(
+        len(map_left), len(map_left[0]), len(map_right[0]), label_left,
+        label_right, tuple(row_index_label), tuple(column_index_label), gap)
+
+    # The whole frame is collected line by line and printed at once
+    lines = list(header_lines)
+
+    # Map values, row by row
+    rows_left = render_map_rows(map_left, row_prefixes, cell_pad)
+    rows_right = render_map_rows(map_right, row_prefixes, cell_pad)
+    lines.extend(f"{row_left}{gap_str}{row_right}"
+                 for row_left, row_right in zip(rows_left, rows_right))
+
+    print_screen("\n".join(lines), clear)
+
+
+def print_map_and_list(map_left, list_text, label_left, label_instructions,
+                       row_index_label, column_index_label, gap=10,
+                       clear=False):
+    """
+    Print a 2D map on the left and a list of instructions on the right with
+    dynamically centered labels and a customizable gap.
+
+    Args:
+        map_left: A 2D list representing the map.
+        list_text: A list of strings representing the instructions, or a
+        single already formatted string with one instruction per line.
+        label_left: Label for the map.
+        label_instructions: Label for the instructions.
+        game_settings: Game map settings including row and column index
+        labels.
+        gap: Number of blank spaces between the map and instructions.
+        Default is 10.
+        clear: Clear the terminal in the same write. Default is False.
+    """
+    if isinstance(list_text, str):
+        list_text = list_text.split("\n")
+
+    (print_map_left_offset, header_line, separator_line, row_prefixes,
+     cell_pad, number_char_table_total) = map_layout(
+        len(map_left), len(map_left[0]), tuple(row_index_label),
+        tuple(column_index_label))
+    gap_str = ' ' * gap
+
+    # The whole frame is collected line by line and printed at once
+    label_left_centered = label_left.center(number_char_table_total)
+    lines = [f"{print_map_left_offset}{label_left_centered}{gap_str}"
+             f"{print_map_left_offset}{label_instructions.center(40)}",
+             header_line + gap_str,
+             separator_line + gap_str]
+
+    # Map rows with the instruction next to them
+    for row_index, map_row in enumerate(
+            render_map_rows(map_left, row_prefixes, cell_pad)):
+        instruction = list_text[row_index] if row_index < len(
             list_text) else ''
-        print(instruction.ljust(40), end="")
-        print()
+        lines.append(f"{map_row}{gap_str}{instruction.ljust(40)}")
+
+    # Instructions left over below the map
+    list_offset = " " * (len(print_map_left_offset) +
+                         number_char_table_total + gap)
     for row_index in range(len(map_left), len(list_text)):
-        print(" " * (num_digits_map_height + len(row_index_separator) +
-                     len(map_left[0]) * (
-                             num_digits_map_width + char_width + 1) +
-                     gap), end="")
-        print(list_text[row_index].ljust(40))
+        lines.append(list_offset + list_text[row_index].ljust(40))
+
+    print_screen("\n".join(lines), clear)
 
 
 def find_max_column_width(table):
@@ -1175,14 +1867,13 @@ def find_max_column_width(table):
     Returns:
         List[int]: A list of maximum widths for each column.
     """
-    max_widths = [0] * len(table[0])
-    for row in table:
-        for i, cell in enumerate(row):
-            max_widths[i] = max(max_widths[i], len(str(cell)))
-    return max_widths
+    # Walk the table column by column, short rows count as empty cells
+    columns = islice(zip_longest(*table, fillvalue=""), len(table[0]))
+    return [max(map(len, map(str, column))) for column in columns]
 
 def print_map_and_table(map_left, table, label_left, label_table,
-                        row_index_label, column_index_label, gap: int = 10):
+                        row_index_label, column_index_label, gap: int = 10,
+                        clear: bool = False):
     """
     Print a 2D map on the left and a table on the right with dynamically
     centered labels and a customizable gap.
@@ -1195,109 +1886,111 @@ def print_map_and_table(map_left, table, label_left, label_table,
         game_settings: Game map settings including row and column index
         labels.
         gap: Number of blank spaces between the map and table. Default is 10.
+        clear: Clear the terminal in the same write. Default is False.
     """
-    # Constants for character dimensions and formatting
-    char_width = len("X")
-
-    num_digits_map_width = find_max_label_length(len(map_left[0]), column_index_label)
-    num_digits_map_height = find_max_label_length(len(map_left), row_index_label)
+    (print_map_left_offset, header_line, separator_line, row_prefixes,
+     cell_pad, number_char_map_total) = map_layout(
+        len(map_left), len(map_left[0]), tuple(row_index_label),
+        tuple(column_index_label))
     max_col_widths = find_max_column_width(table)
+    table_width = sum(max_col_widths) + len(max_col_widths) - 1
     gap_str = ' ' * gap
-    row_index_separator = " | "
-    print_map_left_offset = " " * (num_digits_map_height + len(row_index_separator))
-    number_char_map_total = len(map_left[0]) * (num_digits_map_width + char_width + 1)
     label_left_centered = label_left.center(number_char_map_total)
-    label_table_centered = label_table.center(sum(max_col_widths) + len(max_col_widths) - 1)
-
-    # Print the centered labels for both map and table
-    print(f"{print_map_left_offset}{label_left_centered}{gap_str}{label_table_centered}")
-
-    # Print column headers for the map
-    print(print_map_left_offset, end=" ")
-    for col_index in range(len(map_left[0])):
-        print(str(column_index_label[col_index]).rjust(num_digits_map_width + char_width), end=" ")
-    print(gap_str, end="")
-
-    # Print the table headers
-    for i, header in enumerate(table[0]):
-        print(str(header).ljust(max_col_widths[i]), end=" " if i < len(table[0]) - 1 else "\n")
-
-    # Print the horizontal separator line for the map
-    separator_length_left = len(map_left[0]) * (num_digits_map_width + char_width + 1)
-    print(print_map_left_offset + "=" * separator_length_left, end=gap_str)
-
-    # Print the horizontal separator line for the table
-    print("=" * (sum(max_col_widths) + len(max_col_widths) - 1))
-
-    # Loop through each row to print map values and table rows
-    for row_index, row_left in enumerate(map_left):
-        print(str(row_index_label[row_index]).rjust(num_digits_map_height + 1), end=row_index_separator)
-        for value in row_left:
-            width = len(str(value))
-            print(str(value).rjust(num_digits_map_width + char_width - (char_width - width)), end=" ")
-        print(gap_str, end="")
-
-        # Print the table row if it exists
-        if row_index < len(table) - 1:  # Skip the header row
-            table_row = table[row_index + 1]
-            for i, cell in enumerate(table_row):
-                print(str(cell).ljust(max_col_widths[i]), end=" " if i < len(table_row) - 1 else "\n")
+    label_table_centered = label_table.center(table_width)
+
+    def table_line(table_row):
+        # Cells are left aligned to their column width
+        return " ".join(str(cell).ljust(max_col_widths[i])
+                        for i, cell in enumerate(table_row))
+
+    # The whole frame is collected line by line and printed at once:
+    # labels, column and table headers and separator lines
+    lines = [f"{print_map_left_offset}{label_left_centered}{gap_str}"
+             f"{label_table_centered}",
+             f"{header_line}{gap_str}{table_line(table[0])}",
+             f"{separator_line}{gap_str}{'=' * table_width}"]
+
+    # Map rows with the table row next to them, the header is skipped
+    for row_index, map_row in enumerate(
+            render_map_rows(map_left, row_prefixes, cell_pad)):
+        if row_index < len(table) - 1:
+            lines.append(map_row + gap_str + table_line(table[row_index + 1]))
         else:
-            print()
+            lines.append(map_row + gap_str)
 
     # If there are more rows in the table than the map, print the remaining rows
-    for row_index in range(len(map_left), len(table) - 1):  # Skip the header row
-        print(" " * (num_digits_map_height + len(row_index_separator) + len(map_left[0]) * (num_digits_map_width + char_width + 1) + gap), end="")
-        table_row = table[row_index + 1]
-        for i, cell in enumerate(table_row):
-            print(str(cell).ljust(max_col_widths[i]), end=" " if i < len(table_row) - 1 else "\n")
+    table_offset = " " * (len(print_map_left_offset) +
+                          number_char_map_total + gap)
+    for row_index in range(len(map_left), len(table) - 1):
+        lines.append(table_offset + table_line(table[row_index + 1]))
+
+    print_screen("\n".join(lines), clear)
+
+
+def map_two_maps_line_width(row_label_width, col_label_width, width,
+                            label_left, label_right, gap):
+    """
+    Calculate the length of the longest line print_two_maps would print.
 
+    Args:
+        row_label_width (int): Length of the longest row index label.
+        col_label_width (int): Length of the longest column index label.
+        width (int): The width of each map (number of columns).
+        label_left: Label for the first map.
+        label_right: Label for the second map.
+        gap (int): Number of blank spaces between the two maps.
 
+    Returns:
+        int: Length of the longest printed line in characters.
+    """
+    char_width = len("X")
+    row_index_separator = " | "
 
+    # Width of the map cells, every cell is followed by a single space
+    table_width = width * (col_label_width + char_width + 1)
+    map_left_offset = row_label_width + len(row_index_separator)
 
+    # Line with centered labels, labels longer than the map stick out
+    labels_line = (2 * map_left_offset + gap +
+                   max(table_width, len(label_left)) +
+                   max(table_width, len(label_right)))
+    # Column headers and map rows are one character wider on each side
+    rows_line = 2 * (map_left_offset + 1 + table_width) + gap
 
+    return max(labels_line, rows_line)
 
 
 def map_calculate_max_dimensions(height, width, label_left,
-                                 label_right, row_index_label, column_index_label, gap):
+                                 label_right, row_index_label,
+                                 column_index_label, gap,
+                                 row_label_width=None):
     """
-    Check if two maps of given dimensions and content will fit in the terminal using the simulation approach.
+    Check if two maps of given dimensions and labels will fit in the terminal.
     Automatically fetches the terminal dimensions.
 
     Args:
-        map_left, map_right, label_left, label_right, row_index_label, column_index_label, gap: Same as for print_two_maps
+        height, width, label_left, label_right, row_index_label,
+        column_index_label, gap: Same as for print_two_maps
+        row_label_width (int, optional): Already known length of the longest
+            row label, e.g. game_settings.row_label_width(). Calculated from
+            row_index_label if not given.
 
     Returns:
         bool: Whether the two maps will fit in the terminal.
     """
 
     try:
-        # Redirect stdout to capture the output in a string
-        old_stdout = sys.stdout
-        new_stdout = StringIO()
-        sys.stdout = new_stdout
-
-        map_left = create_map(height, width, "x")
-        # Run the print_two_maps function to simulate printing
-        print_two_maps(map_left, map_left, label_left, label_right,
-                       row_index_label, column_index_label, gap)
-
-        # Reset stdout and get the captured string
-        sys.stdout = old_stdout
-        output_str = new_stdout.getvalue()
-
-
-        # Automatically get terminal dimensions
-        rows, columns = os.popen('stty size', 'r').read().split()
-        terminal_width = int(columns)
-
-        # Debug print statements
+        if row_label_width is None:
+            row_label_width = find_max_label_length(height, row_index_label)
+        col_label_width = find_max_label_length(width, column_index_label)
+        line_width = map_two_maps_line_width(row_label_width,
+                                             col_label_width, width,
+                                             label_left, label_right, gap)
 
+        # Terminal dimensions are kept up to date on window resize
+        terminal_width = TERMINAL_SIZE.columns
 
-        # Check if any line in the captured output exceeds the terminal width
-        will_fit = all(len(line) <= terminal_width for line in output_str.splitlines())
-
-        return will_fit
+        return line_width <= terminal_width
 
     except Exception as e:
         return False
@@ -1329,29 +2022,28 @@ def cpu_deploy_all_ships(map_game, fleet, gaps, symbol):
         bool: True if deployment is successful, False otherwise.
     """
     symbol_allocate_space= "x"
-    while True:
-        try:
-            # Get information about the biggest not deployed ship from the
-            # fleet
-            ship_obj = fleet.get_biggest_ship_by_deployed_status(False)
+    try:
+        # Free space is counted once, afterwards only rows touched by a
+        # deployed ship are recounted
+        symbol_runs = map_symbol_runs(map_game, symbol)
 
-            if ship_obj is None:
+        # Ships not deployed yet, biggest first; the fleet keeps them
+        # sorted by size already
+        ships_to_deploy = [ship for ship in fleet.ships_by_size
+                           if not ship.deployed]
 
-                map_show_only_ships(map_game, symbol_allocate_space, symbol)
-                # If no ships left to deploy, break the loop and return True
-                return map_game  # Deployment is complete
-            else:
-                ship_size = ship_obj.size
+        for ship_obj in ships_to_deploy:
+            ship_size = ship_obj.size
 
-                # Attempt to deploy the ship and get alignment and coordinates
-                return_result = cpu_deploy_single_ship(map_game, ship_size,
-                                                       symbol)
+            # Attempt to deploy the ship and get alignment and coordinates
+            return_result = cpu_deploy_single_ship(map_game, ship_size,
+                                                   symbol, symbol_runs)
 
-                if return_result is False:
-                    # Can't deploy ships, no coordinates found, return False
-                    return False
+            if return_result is False:
+                # Can't deploy ships, no coordinates found, return False
+                return False
 
-                alignment, coordinates_list = return_result
+            alignment, coordinates_list = return_result
 
             ship_obj.set_cell_coordinates(coordinates_list)
             ship_obj.set_alignment(alignment)
@@ -1366,16 +2058,34 @@ def cpu_deploy_all_ships(map_game, fleet, gaps, symbol):
 
             map_game = map_show_symbols(map_game, coordinates_list,
                                         symbols_list)
-        except Exception as e:
-            # Handle exceptions if needed
-            return False  # Return False on error
+
+            # Only rows the ship covers changed, gaps reach one row above
+            # and below it
+            ship_rows = [row for row, _ in coordinates_list]
+            reach = 1 if gaps else 0
+            map_symbol_runs(map_game, symbol, symbol_runs,
+                            range(max(min(ship_rows) - reach, 0),
+                                  min(max(ship_rows) + 1 + reach,
+                                      len(map_game))))
+
+        # No ships left to deploy, only ships are shown on the map
+        map_show_only_ships(map_game, symbol_allocate_space, symbol)
+        return map_game  # Deployment is complete
+    except Exception as e:
+        # Handle exceptions if needed
+        return False  # Return False on error
 
 
 def map_show_only_ships(map, symbol_to_remove, default_symbol):
-    for i in range(len(map)):
-        for j in  range(len(map[0])):
-            if map[i][j] == symbol_to_remove:
-                map[i][j] = default_symbol
+    """
+    Replace every 'symbol_to_remove' on the map with 'default_symbol', the
+    map is updated in place.
+    """
+    for row in map:
+        # Rows without the symbol are left untouched
+        if symbol_to_remove in row:
+            row[:] = [default_symbol if cell == symbol_to_remove else cell
+                      for cell in row]
     return map
 
 def map_show_symbols(map_game, coordinates_list, symbols_list):
@@ -1393,9 +2103,9 @@ def map_show_symbols(map_game, coordinates_list, symbols_list):
     Returns:
         List[List[str]]: The updated 2D game map.
 
-    This function iterates over each coordinate in `coordinates_list`,
-    retrieves the corresponding symbol from `symbols_list`, and updates
-    `map_game` at that coordinate with the symbol.
+    This function pairs each coordinate in `coordinates_list` with the
+    corresponding symbol from `symbols_list`, and updates `map_game` at
+    that coordinate with the symbol.
 
     Note:
         - The length of `coordinates_list` and `symbols_list` should be the
@@ -1406,23 +2116,22 @@ def map_show_symbols(map_game, coordinates_list, symbols_list):
         appearance of a ship cell.
     """
 
-    # Loop through the list of coordinates and symbols to update the game map
-    for i in range(len(coordinates_list)):
-        row, column = coordinates_list[i]  # Extract the row and column for
-        # the ith coordinate
-        map_game[row][column] = symbols_list[i]  # Update the map at the ith
-        # coordinate with the ith symbol
+    # Walk coordinates and symbols together to update the game map
+    for (row, column), cell_symbol in zip(coordinates_list, symbols_list):
+        map_game[row][column] = cell_symbol
 
     return map_game  # Return the updated game map
 
 
-def cpu_deploy_single_ship(map_game, ship_size, symbol):
+def cpu_deploy_single_ship(map_game, ship_size, symbol, symbol_runs=None):
     """
     Deploy a single ship of a given size on the game map.
 
     Parameters:
         map_game (List[List[str]]): The 2D game map.
         ship_size (int): The size of the ship to deploy.
+        symbol_runs (List[List[int]], optional): Free space counted by
+        'map_symbol_runs', passed on to 'search_pattern'.
 
     Returns:
         Union[Tuple[str, List[Tuple[int, int]]], bool]: A tuple containing
@@ -1446,7 +2155,8 @@ def cpu_deploy_single_ship(map_game, ship_size, symbol):
     """
 
     # Get potential coordinates and alignment for the ship
-    return_result = cpu_deploy_get_coordinates(map_game, ship_size, symbol)
+    return_result = cpu_deploy_get_coordinates(map_game, ship_size, symbol,
+                                               symbol_runs)
 
     # Check if coordinates are found
     if not return_result:
@@ -1469,13 +2179,16 @@ def cpu_deploy_single_ship(map_game, ship_size, symbol):
         return alignment, ship_coordinate_list
 
 
-def cpu_deploy_get_coordinates(map_game, ship_size, symbol):
+def cpu_deploy_get_coordinates(map_game, ship_size, symbol,
+                               symbol_runs=None):
     """
     Determine suitable coordinates for deploying a single ship on the game map.
 
     Parameters:
         map_game (List[List[str]]): The 2D game map.
         ship_size (int): The size of the ship to deploy.
+        symbol_runs (List[List[int]], optional): Free space counted by
+        'map_symbol_runs', passed on to 'search_pattern'.
 
     Returns:
         Union[Tuple[str, List[Tuple[int, int]]], bool]: A tuple containing
@@ -1483,9 +2196,13 @@ def cpu_deploy_get_coordinates(map_game, ship_size, symbol):
         suitable coordinates for deploying the ship. Returns False if no
         suitable coordinates are found.
     """
+    # Free space is counted once and shared by both alignment searches
+    if symbol_runs is None:
+        symbol_runs = map_symbol_runs(map_game, symbol)
+
     # Case for ship of size 1
     if ship_size == 1:
-        result = search_pattern(map_game, 1, 1, symbol)
+        result = search_pattern(map_game, 1, 1, symbol, symbol_runs)
         if not result:
             return False
         return "Single", result
@@ -1500,7 +2217,7 @@ def cpu_deploy_get_coordinates(map_game, ship_size, symbol):
     result = search_pattern(map_game,
                             1 if alignment == "Horizontal" else ship_size,
                             1 if alignment == "Vertical" else ship_size,
-                            symbol)
+                            symbol, symbol_runs)
     if result:
         return alignment, result
 
@@ -1509,14 +2226,77 @@ def cpu_deploy_get_coordinates(map_game, ship_size, symbol):
     result = search_pattern(map_game,
                             1 if alignment == "Horizontal" else ship_size,
                             1 if alignment == "Vertical" else ship_size,
-                            symbol)
+                            symbol, symbol_runs)
     if result:
         return alignment, result
 
     return False  # No suitable coordinates found
 
 
-def search_pattern(map_game, height, width, symbol_to_search):
+def map_symbol_runs(map_game, symbol_to_search, symbol_runs=None, rows=None):
+    """
+    Count, for every cell, how many 'symbol_to_search' cells follow it in its
+    row (the cell itself included).
+
+    Args:
+        map_game (List[List[str]]): The 2D game map.
+        symbol_to_search (str): The symbol to count.
+        symbol_runs (List[List[int]], optional): Previously counted runs of
+        the same map, updated in place for the given rows only.
+        rows (Iterable[int], optional): Rows to recount in 'symbol_runs'.
+
+    Returns:
+        List[List[int]]: Run length per cell, every row has one extra
+        trailing 0.
+    """
+    map_width = len(map_game[0])
+    if symbol_runs is None:
+        symbol_runs = [None] * len(map_game)
+        rows = range(len(map_game))
+
+    for row in rows:
+        map_row = map_game[row]
+        row_runs = [0] * (map_width + 1)
+        for col in range(map_width - 1, -1, -1):
+            if map_row[col] == symbol_to_search:
+                row_runs[col] = row_runs[col + 1] + 1
+        symbol_runs[row] = row_runs
+    return symbol_runs
+
+
+def map_largest_square(map_game, symbol_to_search):
+    """
+    Find the side of the largest square made only of 'symbol_to_search'
+    cells, in a single pass over the map.
+
+    Args:
+        map_game (List[List[str]]): The 2D game map.
+        symbol_to_search (str): The symbol the square is made of.
+
+    Returns:
+        int: Side of the largest square, 0 if the symbol is not on the map.
+    """
+    largest = 0
+    # For every cell, side of the largest square ending in it at the bottom
+    # right, the previous row and the current one; index 0 is a border
+    previous_row = [0] * (len(map_game[0]) + 1)
+    for map_row in map_game:
+        current_row = [0]
+        for col, cell in enumerate(map_row, 1):
+            if cell == symbol_to_search:
+                side = 1 + min(previous_row[col], previous_row[col - 1],
+                               current_row[col - 1])
+                if side > largest:
+                    largest = side
+            else:
+                side = 0
+            current_row.append(side)
+        previous_row = current_row
+    return largest
+
+
+def search_pattern(map_game, height, width, symbol_to_search,
+                   symbol_runs=None):
     """
     Search for occurrences of a pattern of 'default symbol' on the map and
     return their coordinates.
@@ -1531,7 +2311,9 @@ def search_pattern(map_game, height, width, symbol_to_search):
         map_game (List[List[str]]): The 2D game map.
         height (int): The height of the pattern to search for.
         width (int): The width of the pattern to search for.
-
+        symbol_to_search (str): The symbol the pattern is made of.
+        symbol_runs (List[List[int]], optional): Result of
+        'map_symbol_runs' for this map and symbol, counted when not given.
 
     Returns:
         List[Tuple[int, int]]: A list of coordinates (row, col) where the
@@ -1547,20 +2329,35 @@ def search_pattern(map_game, height, width, symbol_to_search):
     # found
     coordinates = []
 
-    # Create the pattern using list comprehension
-    pattern = [symbol_to_search * width for _ in range(height)]
-
-    # Traverse the map to find matching patterns
+    # For every cell, count how many searched symbols follow it in a row
+    # (itself included), so a row segment is checked with one comparison
+    if symbol_runs is None:
+        symbol_runs = map_symbol_runs(map_game, symbol_to_search)
+
+    # A single row pattern is read straight from the run counts
+    if height == 1:
+        for row, row_runs in enumerate(symbol_runs):
+            coordinates.extend([row, col]
+                               for col in range(map_width - width + 1)
+                               if row_runs[col] >= width)
+        return coordinates
+
+    # Going upwards, count for every cell how many rows in a row (itself
+    # included) have a run of at least 'width' starting in that column
+    rows_fitting = [[0] * (map_width + 1)]
+    for row in range(map_height - 1, -1, -1):
+        row_runs, below = symbol_runs[row], rows_fitting[-1]
+        rows_fitting.append([below[col] + 1 if row_runs[col] >= width else 0
+                             for col in range(map_width + 1)])
+    rows_fitting.reverse()
+
+    # Traverse the map to find matching patterns, a pattern matches if
+    # enough rows below its top-left corner fit the width
     for row in range(map_height - height + 1):
-        for col in range(map_width - width + 1):
-            # Check if the section of the map matches the pattern
-            if all(
-                    map_game[row + i][col + j] == pattern[i][j]
-                    for i in range(height)
-                    for j in range(width)
-            ):
-                # If the pattern matches, add the coordinates to the list
-                coordinates.append([row, col])
+        row_fitting = rows_fitting[row]
+        coordinates.extend([row, col]
+                           for col in range(map_width - width + 1)
+                           if row_fitting[col] >= height)
     return coordinates  # Return the list of coordinates where the pattern is
 
 
@@ -1586,29 +2383,20 @@ def create_coordinate_list(row, column, alignment, ship_size):
         ship_size (int): The size of the ship.
 
     Returns:
-        list: A list of coordinates where the ship will be placed.
+        List[Tuple[int, int]]: A list of (row, column) coordinates where the
+        ship will be placed.
     """
 
-    # Initialize an empty list to store the coordinates
-    coordinates_list = []
-
     # If the ship size is 1, it only occupies one cell
     if ship_size == 1:
-        coordinates_list.append([row, column])
+        return [(row, column)]
 
-    # For larger ships, we need to calculate the additional coordinates based
-    # on alignment
-    else:
-        # If the ship is aligned horizontally
-        if alignment == "Horizontal":
-            for cell in range(ship_size):
-                coordinates_list.append([row, column + cell])
-
-        # If the ship is aligned vertically
-        if alignment == "Vertical":
-            for cell in range(ship_size):
-                coordinates_list.append([row + cell, column])
-    return coordinates_list
+    # For larger ships, the other cells follow along the alignment
+    if alignment == "Horizontal":
+        return [(row, cell) for cell in range(column, column + ship_size)]
+    if alignment == "Vertical":
+        return [(cell, column) for cell in range(row, row + ship_size)]
+    return []
 
 
 def map_allocate_empty_space_for_ship(map_game, coordinates_list, symbol):
@@ -1623,41 +2411,25 @@ def map_allocate_empty_space_for_ship(map_game, coordinates_list, symbol):
     Args:
         map_game (list): The 2D map where the ship will be deployed.
         coordinates_list (list): List of coordinates where the ship is
-        located.
+        located, ship cells form a straight line.
         symbol (str): The Symbol will be displayed on the game map
 
-    Global Variables:
-        SHIP_SYMBOLS (dict): Dictionary containing ship symbols.
-
     Returns:
         list: Modified game map with empty spaces around the ship.
     """
 
-    # Access the global variable SHIP_SYMBOLS for ship symbols
-
-    # Define the relative positions for empty space around a single cell
-    blank_space = [[-1, -1], [-1, 0], [-1, 1], [0, -1], [0, 0], [0, 1],
-                   [1, -1], [1, 0], [1, 1]]
+    # Ship is a straight line, so the cells next to it form its bounding box
+    # grown by one cell on each side, clipped to the map
+    rows = [row for row, _ in coordinates_list]
+    columns = [column for _, column in coordinates_list]
+    top, bottom = max(min(rows) - 1, 0), min(max(rows) + 2, len(map_game))
+    left = max(min(columns) - 1, 0)
+    right = min(max(columns) + 2, len(map_game[0]))
 
-    # Initialize an empty list to store the coordinates for empty spaces
-    blank_space_coordinates_list = []
-
-    # Calculate the actual positions for empty space around each cell of the
-    # ship
-    for space in blank_space:
-        blank_row, blank_column = space
-        for coordinate in coordinates_list:
-            new_row, new_column = coordinate
-            new_blank_row, new_blank_column = (blank_row + new_row,
-                                               blank_column + new_column)
-            blank_space_coordinates_list.append([new_blank_row,
-                                                 new_blank_column])
-
-    # Update the map to allocate empty space around the ship
-    for new_space in blank_space_coordinates_list:
-        b_row, b_column = new_space
-        if 0 <= b_row < len(map_game) and 0 <= b_column < len(map_game[0]):
-            map_game[b_row][b_column] = symbol
+    # Update the map row by row, each row gets a single slice assignment
+    blank_row = [symbol] * (right - left)
+    for row in range(top, bottom):
+        map_game[row][left:right] = blank_row
 
     return map_game
 
@@ -1672,7 +2444,7 @@ def print_acid_effect():
 
     This function performs the following steps:
     1. Clears the terminal screen for a clean start.
-    2. Prints each character of the `acid_text` string one by one with a
+    2. Prints the `acid_text` string a few characters at a time with a
     slight delay.
     3. Waits for a short moment to let the user view the effect.
     4. Clears the terminal screen again.
@@ -1697,11 +2469,17 @@ wwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwwww
     # Step 1: Clear the terminal
     clear_terminal()
 
-    # Step 2: Print the text character by character
-    for char in acid_logo:
-        print(char, end='', flush=True)  # Using flush=True to force the
-        # output to be printed
-        time.sleep(0.005)  # Delay of 0.005 seconds for each character
+    # Step 2: Print the text a few characters at a time, keeping the pace
+    # of 0.005 seconds per character against a fixed schedule, so sleep
+    # overshoot does not add up
+    chunk_size = 8
+    start = time.perf_counter()
+    for i in range(0, len(acid_logo), chunk_size):
+        print(acid_logo[i:i + chunk_size], end='', flush=True)  # Using
+        # flush=True to force the output to be printed
+        delay = start + 0.005 * (i + chunk_size) - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
 
     # Step 3: Wait for a moment to let the user view the effect
     time.sleep(1)
@@ -1728,19 +2506,20 @@ def game_instructions():
     current_game_fleet = create_fleet() #  creating default fleet
 
 
-    while True:
-        clear_terminal()
-        tmp_fleet = create_fleet(current_game_fleet)
-        tmp_map = tmp_ships_on_map(tmp_fleet, current_game_settings.height,
-                                   current_game_settings.width,
-                                   current_game_settings.gaps,
-                                   current_game_settings.symbol)
-
-        (print_map_and_list(tmp_map, LIST_INSTRUCTIONS, "Ships on Map",
-                            "Instructions", current_game_settings.row_labels,
-                            current_game_settings.col_labels, 5))
+    try:
+        while True:
+            tmp_map = tmp_ships_on_map_cached(current_game_fleet,
+                                              current_game_settings.height,
+                                              current_game_settings.width,
+                                              current_game_settings.gaps,
+                                              current_game_settings.symbol)
+
+            (print_map_and_list(tmp_map, LIST_INSTRUCTIONS, "Ships on Map",
+                                "Instructions",
+                                current_game_settings.row_labels,
+                                current_game_settings.col_labels, 5,
+                                clear=True))
 
-        try:
             user_input = input()
             if user_input.upper() in ["Y", "YES"]:
                 current_game_settings, current_game_fleet \
@@ -1749,10 +2528,10 @@ def game_instructions():
             else:
                 return current_game_settings, current_game_fleet
 
-        except KeyboardInterrupt:
-            clear_terminal()
-            print("You have terminated program")
-            return False  # Return False to indicate interruption
+    except KeyboardInterrupt:
+        clear_terminal()
+        print("You have terminated program")
+        return False  # Return False to indicate interruption
 
 
 
@@ -1763,71 +2542,123 @@ def tmp_ships_on_map(fleet_config, height, width, gaps, symbol):
     time.
 
     Args:
-        game_settings: The settings for the game map.
+        fleet_config (Fleet): Fleet to deploy on the map.
+        height, width, gaps, symbol: Map settings.
 
     Returns:
-        Union[bool, Tuple[List[List[Union[str, int]]], List]]:
-            Returns False if the CPU cannot deploy all the ships.
-            Otherwise, returns a tuple containing the updated game map and
-            game settings.
+        List[List[str]]: Map with all ships deployed. If the fleet could
+        not be deployed in DEPLOY_ATTEMPTS attempts, the map is returned
+        without ships.
     """
 
-    # Create a default fleet for the game
-    while True:
-        # Create a new game map of size 10x10
-        tmp_map_game = create_map(height, width, symbol)
-        tmp_fleet = create_fleet(fleet_config)
+    # Create the game map and fleet once, failed attempts only clear them
+    tmp_map = create_map(height, width, symbol)
+    tmp_fleet = create_fleet(fleet_config)
 
+    for _ in range(DEPLOY_ATTEMPTS):
         # Deploy all ships on the game map
-        tmp_map_game = cpu_deploy_all_ships(tmp_map_game, tmp_fleet, gaps,
+        tmp_map_game = cpu_deploy_all_ships(tmp_map, tmp_fleet, gaps,
                                           symbol)
 
         # Check if all ships were successfully deployed
-        if not tmp_map_game:
-            continue # continue till map is generated
-        else:
+        if tmp_map_game:
             return tmp_map_game
+        map_clear(tmp_map, symbol)
+        tmp_fleet.clear_deployment()
+
+    # Fleet does not fit, show the empty map instead of trying forever
+    return tmp_map
 
 
 
 
+@functools.lru_cache(maxsize=8)
+def tmp_ships_on_map_by_signature(fleet_signature, height, width, gaps,
+                                  symbol):
+    """
+    Deploy a fleet given by its signature on a temporary map, cached so the
+    same settings show the same map on every menu redraw.
+
+    Args:
+        fleet_signature: Result of Fleet.signature().
+        height, width, gaps, symbol: Map settings.
+
+    Returns:
+        Tuple[Tuple[str, ...], ...]: Read-only map with ships deployed.
+    """
+    fleet = Fleet()
+    for name, size, qty in fleet_signature:
+        fleet.add_new_ship(name, size, qty)
+    tmp_map = tmp_ships_on_map(fleet, height, width, gaps, symbol)
+    return tuple(tuple(row) for row in tmp_map)
+
+
+def tmp_ships_on_map_cached(fleet, height, width, gaps, symbol):
+    """
+    Same as tmp_ships_on_map, but a new map is only generated when the
+    fleet composition or map settings have changed.
+
+    Returns:
+        Tuple[Tuple[str, ...], ...]: Read-only map with ships deployed.
+    """
+    return tmp_ships_on_map_by_signature(fleet.signature(), height, width,
+                                         gaps, symbol)
+
+
 def game_change_settings(game_settings, default_fleet):
 
-    while True:
-        clear_terminal()
-        tmp_map = tmp_ships_on_map(default_fleet, game_settings.height,
-                                   game_settings.width, game_settings.gaps,
-                                   game_settings.symbol)
+    # map is generated again only when settings could have been changed
+    tmp_map = None
+    try:
+        while True:
+            if tmp_map is None:
+                tmp_map = tmp_ships_on_map_cached(default_fleet,
+                                                  game_settings.height,
+                                                  game_settings.width,
+                                                  game_settings.gaps,
+                                                  game_settings.symbol)
 
-        print_map_and_list(tmp_map, LIST_GAME_SETTINGS_CHANGES, "Ships on Map",
-                           "Settings", game_settings.row_labels,
-                           game_settings.col_labels, 5)
+            print_map_and_list(tmp_map, LIST_GAME_SETTINGS_CHANGES,
+                               "Ships on Map", "Settings",
+                               game_settings.row_labels,
+                               game_settings.col_labels, 5, clear=True)
 
-        try:
             user_input = input()
             if len(user_input) == 1:
-                if user_input == "0":
+                # menu letters are compared upper cased, converted once
+                menu_key = user_input.upper()
+                if menu_key == "0":
                     return game_settings, default_fleet
-                elif user_input.upper() == "M":
-                    game_settings, default_fleet = settings_map_size_change(
-                        game_settings, default_fleet)
-                elif user_input.upper() == "S":
-                    game_settings, default_fleet = settings_coordinates(
-                        game_settings, default_fleet)
-                elif user_input.upper() == "F":
-                    game_settings, default_fleet = settings_fleet(game_settings, default_fleet)
-
-
+                elif menu_key == "M":
+                    result = settings_map_size_change(game_settings,
+                                                      default_fleet)
+                elif menu_key == "S":
+                    result = settings_coordinates(game_settings,
+                                                  default_fleet)
+                elif menu_key == "F":
+                    result = settings_fleet(game_settings, default_fleet)
+                else:
+                    # nothing has changed, same map is shown again
+                    continue
+                if not result:
+                    return False  # sub menu was interrupted
+                game_settings, default_fleet = result
+                tmp_map = None
 
             else:
-                user_command_input(game_settings, default_fleet, user_input)
+                result = user_command_input(game_settings, default_fleet,
+                                            user_input)
+                if not result:
+                    return False  # command menu was interrupted
+                game_settings, default_fleet = result
+                tmp_map = None
 
 
-        except KeyboardInterrupt:
-            clear_terminal()
-            print("You have terminated game settings changes, I will return "
-                  "back settings that I have at the moment")
-            return False  # Return False to indicate interruption
+    except KeyboardInterrupt:
+        clear_terminal()
+        print("You have terminated game settings changes, I will return "
+              "back settings that I have at the moment")
+        return False  # Return False to indicate interruption
 
 
 
@@ -1838,140 +2669,138 @@ def game_change_settings(game_settings, default_fleet):
 
 
 def user_command_input(game_settings, default_fleet, user_input):
+    # Input the command and texts were made for, they are only made again
+    # when the player types something different
+    matched_input = None
+    try:
+        while True:
+            if user_input != matched_input:
+                matched_input = user_input
+                user_command = find_best_command_match(user_input.lower())
+                if user_command == None:
+                    user_input_list = TEXT_UNKNOWN_COMMAND
 
-    while True:
-        user_command = find_best_match(user_input.lower(), DICTIONARY_COMMANDS)
-        clear_terminal()
-        tmp_map = tmp_ships_on_map(default_fleet, game_settings.height,
-                                   game_settings.width,
-                                   game_settings.gaps,
-                                   game_settings.symbol)
-        if user_command == None:
-            user_input_list = ["I am sorry but i did not understand",
-                               "what You wanted to say", "",
-                               "Please try following commands:", "",
-                               "modify fleet    print fleet",
-                               "modify ship    add ship    delete ship",
-                               "change map size    gaps between ships",
-                               "change coordinate labels    change input",
-                               "start game    reset settings"]
+                else:
+                    user_input_list = TEXT_COMMAND_MATCH.format(
+                        user_input=user_input, user_command=user_command)
 
-        else:
-            user_input_list = [f' You have entered: {user_input}', "",
-                               "I believe you wanted to say:", "",
-                               f'    {user_command}', "",
-                               "If I am correct, just press ENTER", "",
-                               "type 0 to go back"]
+            tmp_map = tmp_ships_on_map_cached(default_fleet,
+                                              game_settings.height,
+                                              game_settings.width,
+                                              game_settings.gaps,
+                                              game_settings.symbol)
 
-        print_map_and_list(tmp_map, user_input_list, "Ships on Map",
-                           "User Command", game_settings.row_labels,
-                           game_settings.col_labels, 5)
+            print_map_and_list(tmp_map, user_input_list, "Ships on Map",
+                               "User Command", game_settings.row_labels,
+                               game_settings.col_labels, 5, clear=True)
 
-        try:
             user_input = input()
             if user_input.strip() == "":
-                execute_user_command(user_command, game_settings,
-                                     default_fleet)
+                # menus give back the changed settings, or False when they
+                # were interrupted; the settings menu takes over from here
+                result = execute_user_command(user_command, game_settings,
+                                              default_fleet)
+                if result is not None:
+                    return result
             if len(user_input) == 1:
                 if user_input == 0:
                     return game_settings, default_fleet
                 print(user_input)
 
 
-        except KeyboardInterrupt:
-            clear_terminal()
-            print("You have terminated game settings changes")
-            return False # Return False to indicate interruption
+    except KeyboardInterrupt:
+        clear_terminal()
+        print("You have terminated game settings changes")
+        return False # Return False to indicate interruption
 
 def execute_user_command(user_command, game_settings, default_fleet):
-    if user_command == "modify fleet":
-        print("function to execute modify fleet")
-    elif user_command == "print fleet":
-        print("function to execute print fleet")
-    elif user_command == "modify ship":
-        print("function to execute modify ship")
-    elif user_command == "add ship":
-        print("function to execute add ship")
-    elif user_command == "delete ship":
-        print("function to execute delete ship")
-    elif user_command == "change map size":
-        game_settings = settings_map_size_change(game_settings,
-                                                     default_fleet)
-    elif user_command == "gaps between ships":
-        print("function to execute gaps between ships")
-    elif user_command == "change coordinate labels":
-        print("function to execute change coordinate labels")
-    elif user_command == "change input":
-        print("function to execute change input")
-    elif user_command == "start game":
-        print("function to execute start game")
-    elif user_command == "reset settings":
-        print("function to execute reset settings")
+    # find_best_command_match gives a list of matches, best one goes first
+    if isinstance(user_command, list):
+        user_command = user_command[0] if user_command else None
+    # commands are looked up in one step instead of comparing them in turn
+    handler = USER_COMMAND_HANDLERS.get(user_command)
+    if handler:
+        return handler(game_settings, default_fleet)
 
 
-def settings_coordinates(game_settings, default_fleet):
-    if game_settings.row_label_symbol.isnumeric():
-        row_label_symbol = "Number"
-    else:
-        row_label_symbol = "Letter"
-    if game_settings.column_label_symbol.isnumeric():
-        column_label_symbol = "Number"
-    else:
-        column_label_symbol = "Letter"
-    text_list = ["Current game Coordinate system is:",
-                 f'Row labels are {row_label_symbol}',
-                 f'Columns are {column_label_symbol}', "",
-                 f'User input is {game_settings.input_style[0]} and '
-                 f'{game_settings.input_style[1]}',"",
-                 "To change Labels type L",
-                 "To change input style press I"]
-    while True:
-        clear_terminal()
-        tmp_map = tmp_ships_on_map(default_fleet, game_settings.height,
-                                   game_settings.width, game_settings.gaps,
-                                   game_settings.symbol)
-        try:
-            print_map_and_list(tmp_map, text_list, "Ships on Map",
-                               "Change Map Size", game_settings.row_labels,
-                               game_settings.col_labels,
-                               game_settings.maps_gap)
-            user_input = input()
-            if len(user_input) == 1:
-                if user_input == "0":
-                    return game_settings, default_fleet
-                elif user_input.upper() == "L":
-                    game_settings, default_fleet =  settings_label_change(
-                        game_settings, default_fleet)
-                elif user_input.upper() == "I":
-                    game_settings, default_fleet = settings_input(
-                        game_settings, default_fleet)
+def settings_coordinates_text(game_settings):
+    """
+    Build the text shown next to the map in the coordinates settings menu.
 
+    Args:
+        game_settings (game_settings): Current game settings.
 
+    Returns:
+        str: Text describing the current coordinate system.
+    """
+    return TEXT_COORDINATES_SETTINGS.format(
+        row_labels="Number" if game_settings.row_label_symbol.isnumeric()
+        else "Letter",
+        column_labels="Number"
+        if game_settings.column_label_symbol.isnumeric() else "Letter",
+        input_0=game_settings.input_style[0],
+        input_1=game_settings.input_style[1])
 
 
+def settings_coordinates(game_settings, default_fleet):
+    text_list = settings_coordinates_text(game_settings)
+    # map is generated again only after returning from a sub menu
+    tmp_map = None
+    try:
+        while True:
+            if tmp_map is None:
+                tmp_map = tmp_ships_on_map_cached(default_fleet,
+                                                  game_settings.height,
+                                                  game_settings.width,
+                                                  game_settings.gaps,
+                                                  game_settings.symbol)
+            print_map_and_list(tmp_map, text_list, "Ships on Map",
+                               "Change Map Size", game_settings.row_labels,
+                               game_settings.col_labels,
+                               game_settings.maps_gap, clear=True)
+            # menu letters are compared upper cased, converted once
+            menu_key = input().upper()
+            if menu_key == "0":
+                return game_settings, default_fleet
+            elif menu_key == "L":
+                result = settings_label_change(game_settings, default_fleet)
+            elif menu_key == "I":
+                result = settings_input(game_settings, default_fleet)
+            else:
+                # nothing has changed, same map is shown again
+                continue
+            if not result:
+                return False  # sub menu was interrupted
+            game_settings, default_fleet = result
+            text_list = settings_coordinates_text(game_settings)
+            tmp_map = None
+
+    except KeyboardInterrupt:
+        print("Game adjustment interrupted.")
+        return False
 
 
-        except KeyboardInterrupt:
-            print("Game adjustment interrupted.")
-            return False
 
+def settings_label_change_text(game_settings):
+    """
+    Build the text shown next to the map in the label settings menu.
 
+    Args:
+        game_settings (game_settings): Current game settings.
 
-def settings_label_change(game_settings, default_fleet):
-    value_0, value_1 = input_output_swap("Row", "Column",
-                                         game_settings.input_style[0],
-                                         game_settings.input_style[1])
+    Returns:
+        List[str]: Lines describing the current row and column labels.
+    """
+    value_0, value_1 = (("Row", "Column") if game_settings.row_first
+                        else ("Column", "Row"))
     string_0 = "Row labels are presented as: {}".format("DIGIT" if
                                                        game_settings.row_label_symbol.isdigit() else "LETTER")
     string_1 = "Column labels are presented as: {}".format("DIGIT" if
                                                            game_settings.column_label_symbol.isdigit() else "LETTER")
-    string_0, string_1 = input_output_swap(string_0, string_1,
-                                           game_settings.input_style[0],
-                                           game_settings.input_style[1])
+    string_0, string_1 = ((string_0, string_1) if game_settings.row_first
+                          else (string_1, string_0))
 
-
-
-    text_list = [
+    return [
         "Current settings for MAP:",
         "",
         string_0,
@@ -1981,64 +2810,38 @@ def settings_label_change(game_settings, default_fleet):
         f'{value_0}, {value_1} symbols, example:',
         f'A,1 = {value_0} - Letters, {value_1} - Digits',"",
         "To go to previous menu type 0"]
-    while True:
-        clear_terminal()
-        tmp_map = tmp_ships_on_map(default_fleet, game_settings.height,
-                                   game_settings.width,
-                                   game_settings.gaps,
-                                   game_settings.symbol)
-        try:
+
+
+def settings_label_change(game_settings, default_fleet):
+    text_list = settings_label_change_text(game_settings)
+    # Labels and input style do not change the ships shown on the map
+    tmp_map = tmp_ships_on_map_cached(default_fleet,
+                                      game_settings.height,
+                                      game_settings.width,
+                                      game_settings.gaps,
+                                      game_settings.symbol)
+    try:
+        while True:
             print_map_and_list(tmp_map, text_list, "Ships on Map",
                                "Change Map Labels",
                                game_settings.row_labels,
                                game_settings.col_labels,
-                               game_settings.maps_gap)
+                               game_settings.maps_gap, clear=True)
             user_input = input()
             #prcessing user input:
             input_valid, split_input, output_text = validate_user_input(
                     user_input, 2,)
             if input_valid:  # if user entered 2 values, we will identify
             # are they numbers or letters, and are they valid
-                input_0, input_1 = input_output_swap(split_input[0],
-                                                      split_input[1], game_settings.input_style[0],
-                                                      game_settings.input_style[1])
+                input_0, input_1 = (
+                    (split_input[0], split_input[1]) if game_settings.row_first
+                    else (split_input[1], split_input[0]))
                 warnings = validate_values(input_0, input_1)
                 if not warnings:
                     game_settings.row_label_symbol = input_0
                     game_settings.column_label_symbol = input_1
                     game_settings.update_labels()
-
-
-                    value_0, value_1 = input_output_swap("Row", "Column",
-                                                         game_settings.input_style[0],
-                                                         game_settings.input_style[1])
-                    string_0 = "Row labels are presented as: {}".format("DIGIT" if
-                                                                        game_settings.row_label_symbol.isdigit() else "LETTER")
-                    string_1 = "Column labels are presented as: {}".format("DIGIT" if
-                                                                           game_settings.column_label_symbol.isdigit() else "LETTER")
-                    string_0, string_1 = input_output_swap(string_0, string_1,
-                                                           game_settings.input_style[0],
-                                                           game_settings.input_style[1])
-
-
-
-                    text_list = [
-                        "Current settings for MAP:",
-                        "",
-                        string_0,
-                        string_1,
-                        "",
-                        "If you want to change it, please type in:",
-                        f'{value_0}, {value_1} symbols, example:',
-                        f'A,1 = {value_0} - Letters, {value_1} - Digits',"",
-                        "To go to previous menu type 0"]
-
-
-
-
-
-
-
+                    text_list = settings_label_change_text(game_settings)
                 else:
                     text_list = ["Sorry but there is an error:","",]
                     text_list.extend(warnings)
@@ -2051,9 +2854,9 @@ def settings_label_change(game_settings, default_fleet):
 
 
 
-        except KeyboardInterrupt:
-            print("Game adjustment interrupted.")
-            return False
+    except KeyboardInterrupt:
+        print("Game adjustment interrupted.")
+        return False
 
 
 def settings_input(game_settings, default_fleet):
@@ -2074,9 +2877,8 @@ def settings_input(game_settings, default_fleet):
     """
 
     # Determine the current input style based on the default settings
-    value_0, value_1 = input_output_swap("Row", "Column",
-                                         game_settings.input_style[0],
-                                         game_settings.input_style[1])
+    value_0, value_1 = (("Row", "Column") if game_settings.row_first
+                        else ("Column", "Row"))
 
     text_list = [
         "Current input style:",
@@ -2087,24 +2889,25 @@ def settings_input(game_settings, default_fleet):
         "Type 0 for previous menu."
     ]
 
-    while True:
-        clear_terminal()
-        tmp_map = tmp_ships_on_map(default_fleet, game_settings.height,
-                                   game_settings.width, game_settings.gaps,
-                                   game_settings.symbol)
-        try:
+    # Labels and input style do not change the ships shown on the map
+    tmp_map = tmp_ships_on_map_cached(default_fleet,
+                                      game_settings.height,
+                                      game_settings.width,
+                                      game_settings.gaps,
+                                      game_settings.symbol)
+    try:
+        while True:
             print_map_and_list(tmp_map, text_list, "Ships on Map",
                                "Change Input Style",
                                game_settings.row_labels,
                                game_settings.col_labels,
-                               game_settings.maps_gap)
+                               game_settings.maps_gap, clear=True)
             user_input = input()
             if user_input == "0":
                 return game_settings, default_fleet
             elif user_input.strip() == "":
-                value_0, value_1 = input_output_swap("Row", "Column",
-                                                     game_settings.input_style[0],
-                                                     game_settings.input_style[1])
+                value_0, value_1 = (("Row", "Column") if game_settings.row_first
+                                    else ("Column", "Row"))
                 text_list = [
                     "Current input style:",
                     f'{value_0} , {value_1}', "",
@@ -2142,59 +2945,26 @@ def settings_input(game_settings, default_fleet):
                     # If values are not understood, show the error message
                     text_list = output_text
 
-        except KeyboardInterrupt:
-            print("Game adjustment interrupted.")
-            return False
-
-
-
-def input_output_swap(input_style1, input_style2, default_style1, default_style2):
-    """
-    Swap input styles if they are in the reverse order of the default styles.
-
-    This function is intended to be used after the input styles have been validated.
-    It checks if the provided input styles are in the reverse order compared to the
-    default styles. If they are, the input styles are swapped to match the default
-    order; otherwise, they are returned as provided.
-
-    Args:
-        input_style1 (str): The first input style potentially to swap.
-        input_style2 (str): The second input style potentially to swap.
-        default_style1 (str): The first default style to compare against.
-        default_style2 (str): The second default style to compare against.
-
-    Returns:
-        (str, str): A tuple of two strings representing the input styles in the correct order.
-    """
-    # Simplify comparison by using the first character of each style, capitalized.
-
-    if default_style1 == "Row" and default_style2 == "Column":
-        return input_style1, input_style2
-    else:
-        return input_style2, input_style1
-
+    except KeyboardInterrupt:
+        print("Game adjustment interrupted.")
+        return False
 
 
 
 def settings_map_size_change(game_settings, default_fleet):
-    text_list = ["Current game settings are set to:","",
-                 "Map Dimensions:", "",
-                 f'Height: {game_settings.height} Width:'
-                 f' {game_settings.width}',"",
-                 "If you would like to change it,",
-                 "please type height and width",
-                 "separated by comma"]
-    while True:
-        clear_terminal()
-        tmp_map = tmp_ships_on_map(default_fleet, game_settings.height,
-                                   game_settings.width,
-                                   game_settings.gaps,
-                                   game_settings.symbol)
-        try:
+    text_list = TEXT_MAP_SIZE_SETTINGS.format(height=game_settings.height,
+                                             width=game_settings.width)
+    try:
+        while True:
+            tmp_map = tmp_ships_on_map_cached(default_fleet,
+                                              game_settings.height,
+                                              game_settings.width,
+                                              game_settings.gaps,
+                                              game_settings.symbol)
 
             print_map_and_list(tmp_map, text_list, "Ships on Map",
                                "Change Map Size", game_settings.row_labels,
-                               game_settings.col_labels, game_settings.maps_gap)
+                               game_settings.col_labels, game_settings.maps_gap, clear=True)
 
             user_input = input()
             if user_input == "0":
@@ -2214,13 +2984,11 @@ def settings_map_size_change(game_settings, default_fleet):
                 check_fit = map_calculate_max_dimensions(
                     height, width, "left", "right",
                     tmp_game_settings.row_labels,
-                    tmp_game_settings.col_labels, tmp_game_settings.maps_gap)
+                    tmp_game_settings.col_labels, tmp_game_settings.maps_gap,
+                    tmp_game_settings.row_label_width())
                 if not check_fit:
-                    t_rows, t_columns = os.popen('stty size', 'r').read(
-
-                    ).split()
-                    terminal_height = int(t_rows)
-                    terminal_width = int(t_columns)
+                    terminal_height = TERMINAL_SIZE.lines
+                    terminal_width = TERMINAL_SIZE.columns
                     text_list = ["Sorry, but map with given dimensions:",
                                  f'Height: {height} and Width: {width}', "",
                                  "Can't align on terminal with dimensions:",
@@ -2233,11 +3001,14 @@ def settings_map_size_change(game_settings, default_fleet):
                         # column labels symbol to letter
                         tmp_game_settings.width = width # generating list
                         # of column symbols
+                        # row labels did not change, so their cached width
+                        # is reused and only column labels are measured
                         check_fit_2 = map_calculate_max_dimensions(
                             height, width, "left", "right",
                             tmp_game_settings.row_labels,
                             tmp_game_settings.col_labels,
-                            tmp_game_settings.maps_gap)
+                            tmp_game_settings.maps_gap,
+                            tmp_game_settings.row_label_width())
                         if not check_fit_2:
                             add_text_list = ["",
                                              "Although there is way around "
@@ -2251,12 +3022,16 @@ def settings_map_size_change(game_settings, default_fleet):
                     # tmp_game_settings, so it will regenerate labels if
                     # map
                     # check if map is bigger, if so create new labels
-                    tmp_map = create_map(split_input[0],split_input[1],
-                                         game_settings.symbol)
-                    tmp_fleet = create_fleet(default_fleet)
-                    tmp_map_game = check_fleet_fits_map(tmp_map, tmp_fleet,
-                                                        tmp_game_settings.symbol,
-                                                        tmp_game_settings.gaps)
+                    if height >= game_settings.height and \
+                            width >= game_settings.width:
+                        # map only grew, fleet that fits current map will
+                        # fit the bigger one as well, no need to deploy it
+                        tmp_map_game = True
+                    else:
+                        tmp_map_game = fleet_fits_map_cached(
+                            default_fleet, height, width,
+                            tmp_game_settings.gaps,
+                            tmp_game_settings.symbol)
                     if not tmp_map_game:
                         text_list = ["Sorry but I DON'T recommend",
                                      "Decreasing Map size with current fleet","",
@@ -2268,12 +3043,9 @@ def settings_map_size_change(game_settings, default_fleet):
                         # dimensions to game settings
                         game_settings.height = tmp_game_settings.height
                         game_settings.width = tmp_game_settings.width
-                        text_list = ["Current game settings are set to:","",
-                                     "Map Dimensions:", "",
-                                     f'Height: {game_settings.height}  Width: {game_settings.width}',"",
-                                     "If you would like to change it,",
-                                     "please type height and width",
-                                     "separated by comma"]
+                        text_list = TEXT_MAP_SIZE_SETTINGS.format(
+                            height=game_settings.height,
+                            width=game_settings.width)
             else:
                 text_list = ["You have entered:", user_input, "",
                              "Sorry but your entered information is ",
@@ -2283,227 +3055,217 @@ def settings_map_size_change(game_settings, default_fleet):
 
 
             # Handle keyboard interrupts to exit the game gracefully
-        except KeyboardInterrupt:
-            print("Game adjustment interrupted.")
-            return False
+    except KeyboardInterrupt:
+        print("Game adjustment interrupted.")
+        return False
+
+
+def command_placeholder(user_command):
+    # commands without a menu yet only report what would be executed
+    return lambda game_settings, default_fleet: print(
+        f"function to execute {user_command}")
+
+
+USER_COMMAND_HANDLERS = {
+    "modify fleet": command_placeholder("modify fleet"),
+    "print fleet": command_placeholder("print fleet"),
+    "modify ship": command_placeholder("modify ship"),
+    "add ship": command_placeholder("add ship"),
+    "delete ship": command_placeholder("delete ship"),
+    "change map size": settings_map_size_change,
+    "gaps between ships": command_placeholder("gaps between ships"),
+    "change coordinate labels": command_placeholder(
+        "change coordinate labels"),
+    "change input": command_placeholder("change input"),
+    "start game": command_placeholder("start game"),
+    "reset settings": command_placeholder("reset settings"),
+}
 
 
 def settings_fleet(game_settings, default_fleet):
     text_list = [["    Add ship - type A"],["    Modify Ship - type M"],
                  ["    Delete ship - type D"],["    Return to previous Menu - "
                                                "type 0"]]
-    while True:
-        clear_terminal()
-        tmp_map = tmp_ships_on_map(default_fleet, game_settings.height,
-                                   game_settings.width,
-                                   game_settings.gaps,
-                                   game_settings.symbol)
-        try:
+    try:
+        while True:
+            tmp_map = tmp_ships_on_map_cached(default_fleet,
+                                              game_settings.height,
+                                              game_settings.width,
+                                              game_settings.gaps,
+                                              game_settings.symbol)
 
             fleet_table = default_fleet.fleet_to_table(game_settings,
                                                        [])
             fleet_table.extend(text_list)
             print_map_and_table(tmp_map, fleet_table, "Ships On Map",
-                                "Fleet", game_settings.row_labels, game_settings.col_labels, game_settings.maps_gap)
+                                "Fleet", game_settings.row_labels, game_settings.col_labels, game_settings.maps_gap, clear=True)
 
 
             user_input = input()
             if len(user_input) == 1:
-                if user_input == "0":
+                # menu letters are compared upper cased, converted once
+                menu_key = user_input.upper()
+                if menu_key == "0":
                     return game_settings, default_fleet
-                elif user_input.upper() == "A":
+                elif menu_key == "A":
                     game_settings, default_fleet = settings_fleet_add_ship(game_settings, default_fleet)
-                elif user_input.upper() == "M":
+                elif menu_key == "M":
                     game_settings, default_fleet = settings_fleet_change_ship(game_settings, default_fleet)
-                elif user_input.upper() == "D":
+                elif menu_key == "D":
                     game_settings, default_fleet = settings_fleet_delete_ship(
                         game_settings, default_fleet)
 
-        except KeyboardInterrupt:
-            print("Game adjustment interrupted.")
-            return False
-
-
-
-def settings_fleet_delete_ship(game_settings, default_fleet):
-    fleet_table = default_fleet.fleet_to_table(game_settings,
-                                               [])
-    text_list = [["To Delete ship type in ship name"],
-                 ["Or type in ship index number:"],
-                 [f'Egzample 1 - {fleet_table[1][0]}'],
-                 ["Return to previous menu type - 0"]]
-    while True:
-        clear_terminal()
-        tmp_map = tmp_ships_on_map(default_fleet, game_settings.height,
-                                   game_settings.width,
-                                   game_settings.gaps,
-                                   game_settings.symbol)
-        try:
-
-            fleet_table = default_fleet.fleet_to_table(game_settings,
-                                                       [])
-            fleet_index = len(fleet_table)
-            fleet_table.extend(text_list)
-            print_map_and_table(tmp_map, fleet_table, "Ships On Map",
-                                " Delete ship from Fleet",
-                                game_settings.row_labels, game_settings.col_labels, game_settings.maps_gap)
-
-
-
-            user_input = input()
-            if len(user_input) >0:
-                if user_input.isdigit():
-                    if user_input == "0":
-                        return game_settings, default_fleet
-
-                    elif 1 <= int(user_input) <= int(fleet_index):
-                        ship_name = fleet_table[int(user_input)][0]
-                        ship_size = fleet_table[int(user_input)][1]
-                        ship_qty = fleet_table[int(user_input)][2]
-                        default_fleet.remove_ships_by_name(ship_name)
-                        text_list = [["You have removed ship:"],
-                                     [ship_name, ship_size, ship_qty],[""],
-                                     ["Return to previous menu type - 0"]]
-
-                    else:
-                        text_list = [[f'You have entered {user_input}'],
-                                     ["There is no ship with such index"]]
-
-                else:
-                    if user_input.upper() == "Y":
-                        default_fleet.remove_ships_by_name(ship_name[0])
-                        text_list = [["You have removed ship:"],
-                             [ship_name, ship_size, ship_qty],[""],
-                             ["Return to previous menu type - 0"]]
-                    else:
-
-
-                        ship_dictionary = create_ship_dictionary_from_fleet(default_fleet)
-
-                        ship_name = find_best_match(user_input, ship_dictionary)
-
-                        if ship_name is not None:
-                            ship_test = default_fleet.get_ship(ship_name[0])
-                            ship_size = ship_test.size
-                            ship_qty = default_fleet.get_ship_quantity(
-                                ship_name[0])
-                            text_list = [["You have selcted to delete:"],
-                                         [ship_name[0], ship_size, ship_qty],
-                                         ["To delete it type Y"],
-                                         ["Return to previous menu type - 0"]]
+    except KeyboardInterrupt:
+        print("Game adjustment interrupted.")
+        return False
 
-                        else:
-                            text_list = [["Sorry I did not understand your "
-                                          "input"],
-                                         ["Please try again typing ship name"],
-                                         [""],
-                                         ["Return to previous menu type - 0"]]
 
 
+def settings_fleet_select_text(action, fleet_table):
+    """
+    Build the text rows shown under the fleet table, when a ship has to be
+    selected by its name or index.
 
-            else:
-                fleet_table = default_fleet.fleet_to_table(game_settings,
-                                                           [])
-                text_list = [["To Delete ship type in ship name"],
-                             ["Or type in ship index number:"],
-                             [f'Egzample 1 - {fleet_table[1][0]}'],
-                             ["Return to previous menu type - 0"]]
+    Args:
+        action (str): What will be done with the ship, e.g. "Delete".
+        fleet_table (list): Fleet table, the first ship is used as example.
 
+    Returns:
+        list: Table rows with one line of text each.
+    """
+    return [[line.format(action=action, example=fleet_table[1][0])]
+            for line in TEXT_FLEET_SELECT_SHIP]
 
-        except KeyboardInterrupt:
-            print("Game adjustment interrupted.")
-            return False
 
+def settings_fleet_select_ship(game_settings, default_fleet, action, title,
+                               on_ship_selected):
+    """
+    Menu where the player selects a ship of the fleet by its index, or by its
+    name and a confirmation. Delete and change ship menus only differ in
+    what is done with the selected ship.
 
+    Args:
+        game_settings (game_settings): Current game settings.
+        default_fleet (Fleet): Fleet the ship is selected from.
+        action (str): What is done with the ship, e.g. "Delete".
+        title (str): Label shown above the fleet table.
+        on_ship_selected (Callable): Called with game_settings,
+            default_fleet and the selected ship name, size and quantity.
+            Returns game_settings, default_fleet and the text to show next,
+            or None for the text to stay as it is.
 
-def settings_fleet_change_ship(game_settings, default_fleet):
+    Returns:
+        tuple: game_settings and default_fleet, False if interrupted.
+    """
     fleet_table = default_fleet.fleet_to_table(game_settings,
                                                [])
-    text_list = [["To Modify ship type in ship name"],
-                 ["Or type in ship index number:"],
-                 [f'Egzample 1 - {fleet_table[1][0]}'],
-                 ["Return to previous menu type - 0"]]
-    while True:
-        clear_terminal()
-        tmp_map = tmp_ships_on_map(default_fleet, game_settings.height,
-                                   game_settings.width,
-                                   game_settings.gaps,
-                                   game_settings.symbol)
-        try:
-
-            fleet_table = default_fleet.fleet_to_table(game_settings,
-                                                       [])
-            fleet_index = len(fleet_table)
-            fleet_table.extend(text_list)
-            print_map_and_table(tmp_map, fleet_table, "Ships On Map",
-                                " Change Ship in Fleet",
-                                game_settings.row_labels, game_settings.col_labels, game_settings.maps_gap)
-
-
+    text_list = settings_fleet_select_text(action, fleet_table)
+    # ship found by its name, it is used once the player confirms it
+    selected_ship = None
+    # map and fleet table are only made again after the fleet has changed
+    table_fleet = table_fleet_version = None
+    try:
+        while True:
+            if (default_fleet is not table_fleet or
+                    default_fleet.version != table_fleet_version):
+                table_fleet = default_fleet
+                table_fleet_version = default_fleet.version
+                tmp_map = tmp_ships_on_map_cached(default_fleet,
+                                                  game_settings.height,
+                                                  game_settings.width,
+                                                  game_settings.gaps,
+                                                  game_settings.symbol)
+                fleet_base_table = default_fleet.fleet_to_table(game_settings,
+                                                                [])
+
+            # rows after the header are ships, their index is the row index
+            fleet_index = len(fleet_base_table)
+            fleet_table = fleet_base_table + text_list
+            # screen is drawn only when there is no input waiting already
+            if not input_pending():
+                print_map_and_table(tmp_map, fleet_table, "Ships On Map",
+                                    title, game_settings.row_labels,
+                                    game_settings.col_labels,
+                                    game_settings.maps_gap, clear=True)
 
             user_input = input()
+            ship_row = None
             if len(user_input) >0:
                 if user_input.isdigit():
-                    if user_input == "0":
+                    ship_index = int(user_input)
+                    if ship_index == 0:
                         return game_settings, default_fleet
 
-                    elif 1 <= int(user_input) <= int(fleet_index):
-                        ship_name = fleet_table[int(user_input)][0]
-                        game_settings, default_fleet = settings_fleet_change_selected_ship(game_settings,
-                                                            default_fleet,
-                                                            ship_name)
-
-
-
-
+                    elif 1 <= ship_index < fleet_index:
+                        ship_row = fleet_table[ship_index][:3]
 
                     else:
                         text_list = [[f'You have entered {user_input}'],
                                      ["There is no ship with such index"]]
 
+                elif user_input in ("Y", "y") and selected_ship:
+                    ship_row = selected_ship
+
                 else:
-                    if user_input.upper() == "Y":
-                        text_list = [["You have removed ship:"],
-                                     [ship_name, ship_size, ship_qty],[""],
+                    ship_name = find_best_match(
+                        user_input, default_fleet.ship_dictionary())
+
+                    if ship_name is not None:
+                        ship_test = default_fleet.get_ship(ship_name[0])
+                        selected_ship = (ship_name[0], ship_test.size,
+                                         default_fleet.get_ship_quantity(
+                                             ship_name[0]))
+                        text_list = [[f"You have selcted to "
+                                      f"{action.lower()}:"],
+                                     list(selected_ship),
+                                     [f"To {action.lower()} it type Y"],
                                      ["Return to previous menu type - 0"]]
-                    else:
 
+                    else:
+                        text_list = [["Sorry I did not understand your "
+                                      "input"],
+                                     ["Please try again typing ship name"],
+                                     [""],
+                                     ["Return to previous menu type - 0"]]
 
-                        ship_dictionary = create_ship_dictionary_from_fleet(default_fleet)
+            else:
+                text_list = settings_fleet_select_text(action, fleet_table)
 
-                        ship_name = find_best_match(user_input, ship_dictionary)
+            if ship_row is not None:
+                selected_ship = None
+                game_settings, default_fleet, next_text = on_ship_selected(
+                    game_settings, default_fleet, *ship_row)
+                if next_text is not None:
+                    text_list = next_text
 
-                        if ship_name is not None:
-                            ship_test = default_fleet.get_ship(ship_name[0])
-                            ship_size = ship_test.size
-                            ship_qty = default_fleet.get_ship_quantity(
-                                ship_name[0])
-                            text_list = [["You have selcted to delete:"],
-                                         [ship_name[0], ship_size, ship_qty],
-                                         ["To change it type Y"],
-                                         ["Return to previous menu type - 0"]]
+    except KeyboardInterrupt:
+        print("Game adjustment interrupted.")
+        return False
 
-                        else:
-                            text_list = [["Sorry I did not understand your "
-                                          "input"],
-                                         ["Please try again typing ship name"],
-                                         [""],
-                                         ["Return to previous menu type - 0"]]
 
+def settings_fleet_delete_ship(game_settings, default_fleet):
+    def delete_ship(game_settings, default_fleet, ship_name, ship_size,
+                    ship_qty):
+        default_fleet.remove_ships_by_name(ship_name)
+        return game_settings, default_fleet, [
+            ["You have removed ship:"], [ship_name, ship_size, ship_qty],
+            [""], ["Return to previous menu type - 0"]]
 
-            else:
-                fleet_table = default_fleet.fleet_to_table(game_settings,
-                                                           [])
-                text_list = [["To Delete ship type in ship name"],
-                             ["Or type in ship index number:"],
-                             [f'Egzample 1 - {fleet_table[1][0]}'],
-                             ["Return to previous menu type - 0"]]
+    return settings_fleet_select_ship(game_settings, default_fleet,
+                                      "Delete", " Delete ship from Fleet",
+                                      delete_ship)
 
 
-        except KeyboardInterrupt:
-            print("Game adjustment interrupted.")
-            return False
+def settings_fleet_change_ship(game_settings, default_fleet):
+    def change_ship(game_settings, default_fleet, ship_name, ship_size,
+                    ship_qty):
+        game_settings, default_fleet = settings_fleet_change_selected_ship(
+            game_settings, default_fleet, ship_name)
+        return game_settings, default_fleet, None
 
+    return settings_fleet_select_ship(game_settings, default_fleet,
+                                      "Modify", " Change Ship in Fleet",
+                                      change_ship)
 
 
 def settings_fleet_change_selected_ship(game_settings, default_fleet,
@@ -2515,25 +3277,25 @@ def settings_fleet_change_selected_ship(game_settings, default_fleet,
                  ["2 Values:"],["Size, QTY"],[""],
                  ["3 Values:"],["New Name, Size, QTY"],[""],
                  ["To go back type 0"]]
-    while True:
-        try:
+    try:
+        while True:
             fleet_table = [['Name', 'Size', 'Qty'],
                            [ship_name, ship_size, ship_qty]]
             fleet_table.extend(text_list)
-            clear_terminal()
-            tmp_map = tmp_ships_on_map(default_fleet, game_settings.height,
-                                       game_settings.width,
-                                       game_settings.gaps,
-                                       game_settings.symbol)
+            tmp_map = tmp_ships_on_map_cached(default_fleet,
+                                              game_settings.height,
+                                              game_settings.width,
+                                              game_settings.gaps,
+                                              game_settings.symbol)
             print_map_and_table(tmp_map, fleet_table, "Ships On Map",
                                 " Your selected Ship",
                                 game_settings.row_labels, game_settings.col_labels,
-                                game_settings.maps_gap)
+                                game_settings.maps_gap, clear=True)
             user_input = input()
             if user_input == "0":
                 return game_settings, default_fleet
             else:
-                input_parts = re.split(r'[^A-Za-z0-9]+', user_input)
+                input_parts = INPUT_SPLIT_PATTERN.split(user_input)
 
                 # now we shall check how many values user has used, if 2:
                 if len(input_parts) == 2:
@@ -2546,17 +3308,15 @@ def settings_fleet_change_selected_ship(game_settings, default_fleet,
                         new_ship_name = ship_name
                         new_ship_size = split_input[0]
                         new_ship_qty = split_input[1]
-                        test_map = create_map(game_settings.height,
-                                              game_settings.width,
-                                              game_settings.symbol)
                         test_fleet = create_fleet(default_fleet)
                         test_fleet.remove_ships_by_name(ship_name)
                         test_fleet.add_new_ship(new_ship_name, new_ship_size,
                                                 new_ship_qty)
-                        result = check_fleet_fits_map(test_map,
-                                                      test_fleet,
-                                                      game_settings.symbol,
-                                                      game_settings.maps_gap)
+                        result = fleet_fits_map_cached(test_fleet,
+                                                       game_settings.height,
+                                                       game_settings.width,
+                                                       game_settings.maps_gap,
+                                                       game_settings.symbol)
                         if not result:
                             text_list = [[""],["I do not recommend such ship:"],
                                          [new_ship_name, new_ship_size,
@@ -2571,30 +3331,23 @@ def settings_fleet_change_selected_ship(game_settings, default_fleet,
                         text_list = [""]
                         text_list.append(output_text)
                 elif len(input_parts) == 3:
-                    new_ship_size = int(input_parts[1])
-                    new_ship_qty = int(input_parts[2])
-                    size_qty_string = ', '.join([str(new_ship_size),
-                                                 str(new_ship_qty)])
                     new_ship_name = input_parts[0]
                     input_valid, split_input, output_text = (
-                        validate_user_input(
-                            size_qty_string, 2, "integer"))
+                        validate_integer_parts(input_parts[1:]))
                     if input_valid:
                         # if both values are integers, we will test if given
                         # ship modification in fleet will fit on map:
                         new_ship_size = split_input[0]
                         new_ship_qty = split_input[1]
-                        test_map = create_map(game_settings.height,
-                                              game_settings.width,
-                                              game_settings.symbol)
                         test_fleet = create_fleet(default_fleet)
                         test_fleet.remove_ships_by_name(ship_name)
                         test_fleet.add_new_ship(new_ship_name, new_ship_size,
                                                 new_ship_qty)
-                        result = check_fleet_fits_map(test_map,
-                                                      test_fleet,
-                                                      game_settings.symbol,
-                                                      game_settings.maps_gap)
+                        result = fleet_fits_map_cached(test_fleet,
+                                                       game_settings.height,
+                                                       game_settings.width,
+                                                       game_settings.maps_gap,
+                                                       game_settings.symbol)
                         if not result:
                             text_list = [[""], ["I do not recommend such ship:"],
                                          [new_ship_name, new_ship_size,
@@ -2622,31 +3375,38 @@ def settings_fleet_change_selected_ship(game_settings, default_fleet,
 
 
 
-        except KeyboardInterrupt:
-            print("Game adjustment interrupted.")
-            return False
+    except KeyboardInterrupt:
+        print("Game adjustment interrupted.")
+        return False
 
 
 
 
 
 def settings_fleet_add_ship(game_settings, default_fleet):
-    text_list = [["Type ship name, size and quantity"],
-                 ["Egzample: Tugboat,1,4"], ["To go back type 0"]]
-    while True:
-        clear_terminal()
-        tmp_map = tmp_ships_on_map(default_fleet, game_settings.height,
-                                   game_settings.width,
-                                   game_settings.gaps,
-                                   game_settings.symbol)
-        try:
+    text_list = list(TEXT_FLEET_ADD_SHIP)
+    # map and fleet table are only made again after the fleet has changed
+    table_fleet = table_fleet_version = None
+    try:
+        while True:
+            if (default_fleet is not table_fleet or
+                    default_fleet.version != table_fleet_version):
+                table_fleet = default_fleet
+                table_fleet_version = default_fleet.version
+                tmp_map = tmp_ships_on_map_cached(default_fleet,
+                                                  game_settings.height,
+                                                  game_settings.width,
+                                                  game_settings.gaps,
+                                                  game_settings.symbol)
+                fleet_base_table = default_fleet.fleet_to_table(game_settings,
+                                                                [])
 
-            fleet_table = default_fleet.fleet_to_table(game_settings,
-                                                       [])
-            fleet_table.extend(text_list)
-            print_map_and_table(tmp_map, fleet_table, "Ships On Map",
-                                " Add Ship to Fleet",
-                                game_settings.row_labels, game_settings.col_labels, game_settings.maps_gap)
+            fleet_table = fleet_base_table + text_list
+            # screen is drawn only when there is no input waiting already
+            if not input_pending():
+                print_map_and_table(tmp_map, fleet_table, "Ships On Map",
+                                    " Add Ship to Fleet",
+                                    game_settings.row_labels, game_settings.col_labels, game_settings.maps_gap, clear=True)
 
 
             user_input = input()
@@ -2662,26 +3422,20 @@ def settings_fleet_add_ship(game_settings, default_fleet):
                     ship_test = default_fleet.get_ship(ship_name)
                     if not ship_test:
                         # checking if last 2 values are integers
-                        ship_size = int(split_input[1])
-                        ship_qty = int(split_input[2])
-                        size_qty_string = ', '.join([str(ship_size),
-                                                     str(ship_qty)])
                         input_valid, split_input, output_text = (
-                            validate_user_input(
-                                size_qty_string, 2, "integer"))
+                            validate_integer_parts(split_input[1:]))
                         if input_valid:
+                            ship_size, ship_qty = split_input
 
                             # now all validation is done, we will check if
                             # modified fleet will fit on map
                             # generating temporary map and fleet
-                            test_map = create_map(game_settings.height,
-                                                  game_settings.width,
-                                                 game_settings.symbol)
                             test_fleet = create_fleet(default_fleet)
                             test_fleet.add_new_ship(ship_name, ship_size, ship_qty)
-                            result = check_fleet_fits_map(test_map,
-                                                        test_fleet,
-                                                          game_settings.symbol, game_settings.maps_gap)
+                            result = fleet_fits_map_cached(
+                                test_fleet, game_settings.height,
+                                game_settings.width, game_settings.maps_gap,
+                                game_settings.symbol)
                             if not result:
                                 text_list = [["I do not recommend such ship:"],
                                              [ship_name, ship_size, ship_qty],
@@ -2706,36 +3460,99 @@ def settings_fleet_add_ship(game_settings, default_fleet):
                 else:
                     text_list.append(output_text)
             else:
-                text_list = [["Type ship name, size and quantity"],
-                             ["Egzample: Tugboat,1,4"], ["To go back type 0"]]
+                text_list = list(TEXT_FLEET_ADD_SHIP)
 
 
 
 
-        except KeyboardInterrupt:
-            print("Game adjustment interrupted.")
-            return False
+    except KeyboardInterrupt:
+        print("Game adjustment interrupted.")
+        return False
+
 
 
 
+def fleet_fits_map_area(fleet, height, width, gaps):
+    """
+    Check without deploying ships, if a fleet can possibly fit on a map.
+
+    A ship longer than both map sides never fits. Without gaps, ship cells
+    can't take more than the whole map. With gaps, every ship together with
+    the cells right of it and below it takes a 2 by (size + 1) block.
+    Blocks of ships that don't touch never overlap, and all of them lie on
+    the map grown by one row and one column.
+
+    Args:
+        fleet (Fleet): Fleet to check.
+        height, width (int): Map dimensions.
+        gaps: Ships keep one cell of space between each other.
+
+    Returns:
+        bool: False if the fleet surely does not fit, True if it might.
+    """
+    sizes = [ship.size for ship in fleet.ships]
+    if not sizes:
+        return True
+    if max(sizes) > max(height, width):
+        return False
+    if gaps:
+        return 2 * (sum(sizes) + len(sizes)) <= (height + 1) * (width + 1)
+    return sum(sizes) <= height * width
+
+
+@functools.lru_cache(maxsize=64)
+def fleet_fits_map_by_signature(fleet_signature, height, width, gaps,
+                                symbol):
+    """
+    Cached check if a fleet given by its signature can be deployed on a
+    map, so the same fleet and map are only tried once.
+
+    Args:
+        fleet_signature: Result of Fleet.signature().
+        height, width, gaps, symbol: Map settings.
+
+    Returns:
+        bool: True if all ships were deployed.
+    """
+    fleet = Fleet()
+    for name, size, qty in fleet_signature:
+        fleet.add_new_ship(name, size, qty)
+    return bool(check_fleet_fits_map(create_map(height, width, symbol),
+                                     fleet, symbol, gaps))
+
+
+def fleet_fits_map_cached(fleet, height, width, gaps, symbol):
+    """
+    Same as check_fleet_fits_map on a new map, the answer is reused while
+    the fleet composition and map settings stay the same.
+
+    Returns:
+        bool: True if all ships were deployed.
+    """
+    return fleet_fits_map_by_signature(fleet.signature(), height, width,
+                                       gaps, symbol)
+
 
 def check_fleet_fits_map(map_game, fleet_config, symbol, gaps):
+    # fleets that can't fit by their area or ship length are rejected
+    # without trying to deploy them
+    if not fleet_fits_map_area(fleet_config, len(map_game),
+                               len(map_game[0]), gaps):
+        return False
     # this function will use cpu_deploy_all_ships in loop for 50 times,
     # till ships are deployed, if after 50 attempts no luck to deploy all of
     # them, it means ships do not fit on map, player has to reduce fleet
-    for _ in range(50):
-        tmp_fleet = create_fleet(fleet_config)
-
-        # Create a new game map of size 10x10
-        tmp_map = map_game
-
+    # fleet is copied once, so ships of fleet_config stay not deployed
+    tmp_fleet = create_fleet(fleet_config)
+    for _ in range(DEPLOY_ATTEMPTS):
         # Deploy all ships on the game map
-        map_game = cpu_deploy_all_ships(tmp_map, tmp_fleet,
-                                        gaps, symbol)
-        if not map_game:
-            continue
-        else:
-            return map_game
+        tmp_map_game = cpu_deploy_all_ships(map_game, tmp_fleet,
+                                            gaps, symbol)
+        if tmp_map_game:
+            return tmp_map_game
+        # failed attempt leaves ships on the map, it is cleared for the next
+        map_clear(map_game, symbol)
+        tmp_fleet.clear_deployment()
     return False # if after 50 attempts fleet doe4s not fit map, we return
     # false
 
@@ -2768,6 +3585,11 @@ def cpu_find_biggest_ship_on_map(map_game, size, symbol):
     """
     Searches for the biggest ship on the map represented by a specific symbol.
 
+    Windows are tried from the biggest square of side size * 2 - 1 down to
+    side size, every square followed by the two rectangles one cell
+    narrower and one cell lower. The first window size found on the map
+    wins.
+
     Args:
     map_game (list): The game map or grid.
     size (int): The initial size parameter for the ship.
@@ -2776,56 +3598,45 @@ def cpu_find_biggest_ship_on_map(map_game, size, symbol):
     Returns:
     list: List of center coordinates of the largest ship found.
     """
-    # Initialize an empty list for storing coordinates
-    coordinates_list = []
-
     # Begin with the maximum possible size
-    width = size * 2 - 1
-    height = size * 2 - 1
-
-    # Main loop to find the biggest ship
-    while True:
-        coordinates_list = search_pattern(map_game, height, width, symbol)
-
-        # If coordinates are found, calculate their center and return
+    biggest = size * 2 - 1
+
+    # A square or rectangle can only fit if the largest free square is at
+    # least as big as its shorter side, so all windows bigger than that are
+    # skipped without searching them
+    largest_square = map_largest_square(map_game, symbol)
+
+    # Free space is counted once and shared by all searches below, the map
+    # does not change while searching
+    symbol_runs = map_symbol_runs(map_game, symbol)
+
+    if largest_square >= biggest:
+        coordinates_list = search_pattern(map_game, biggest, biggest, symbol,
+                                          symbol_runs)
+        return get_coordinates_center(biggest, biggest, coordinates_list)
+
+    # Rectangles one cell longer than the largest square are the biggest
+    # windows that can still fit
+    side = largest_square + 1
+    if side < size:
+        return []  # Return an empty list if no ship is found
+    center_list = []
+    for height, width in ((side, side - 1), (side - 1, side)):
+        coordinates_list = search_pattern(map_game, height, width, symbol,
+                                          symbol_runs)
         if coordinates_list:
-            return get_coordinates_center(height, width, coordinates_list)
-
-        # If not found, reduce the dimensions and search again
-        else:
-            width -= 1
-            coordinates_list = search_pattern(map_game, height, width, symbol)
-            if coordinates_list:
-                width_center_list = get_coordinates_center(height, width,
-                                                       coordinates_list)
-            else:
-                width_center_list = []
-
-            # Restore width and reduce height for the next search
-            width += 1
-            height -= 1
-            coordinates_list = search_pattern(map_game, height, width, symbol)
-            if coordinates_list:
-                height_center_list = get_coordinates_center(height, width,
-                                                        coordinates_list)
-            else:
-                height_center_list = []
-
-            # Combine results from width and height reductions
-            center_list = width_center_list + height_center_list
-
-            # Return if centers are found
-            if center_list:
-                return center_list
-            else:
-                width -=1 # reducing width, height is already reduced
-
-            # Check for minimum dimensions to avoid infinite loop
-            if width < size or height < size:
-                break
-
-    return []  # Return an empty list if no ship is found
-
+            center_list += get_coordinates_center(height, width,
+                                                  coordinates_list)
+    if center_list:
+        return center_list
+
+    # Otherwise the largest square itself is the biggest window
+    side -= 1
+    if side < size:
+        return []  # Return an empty list if no ship is found
+    coordinates_list = search_pattern(map_game, side, side, symbol,
+                                      symbol_runs)
+    return get_coordinates_center(side, side, coordinates_list)
 
 def get_coordinates_center(height, width, coordinates_list):
     """
@@ -2840,20 +3651,18 @@ def get_coordinates_center(height, width, coordinates_list):
     Returns:
         list of tuples: A list containing the center coordinates.
     """
-    center_rows = calculate_center(height)
-    center_columns = calculate_center(width)
+    # Offsets of all center cells inside the grid, the same for every
+    # coordinate
+    center_offsets = [(center_row, center_column)
+                      for center_row in calculate_center(height)
+                      for center_column in calculate_center(width)]
 
-    center_list = []
-    for coord_row, coord_column in coordinates_list:
-        for center_row in center_rows:
-            for center_column in center_columns:
-                final_row = coord_row + center_row
-                final_column = coord_column + center_column
-                center_list.append((final_row, final_column))
-
-            return center_list
+    return [(coord_row + center_row, coord_column + center_column)
+            for coord_row, coord_column in coordinates_list
+            for center_row, center_column in center_offsets]
 
 
+@functools.lru_cache(maxsize=None)
 def calculate_center(dimension):
     """
     Calculates the center points for a given dimension.
@@ -2861,13 +3670,13 @@ def calculate_center(dimension):
     Args:
         dimension (int): The dimension of the grid (either height or width).
     Returns:
-        list: A list of center point(s).
+        tuple: The center point(s), shared between calls.
     """
 
     if dimension % 2 == 1:
-        return [dimension // 2]
+        return (dimension // 2,)
     else:
-        return [dimension // 2 - 1, dimension // 2]
+        return (dimension // 2 - 1, dimension // 2)
 
 
 """Initial game start functions
@@ -2882,8 +3691,12 @@ def start_game():
     game_settings, default_fleet = game_instructions()
     game_log = BattleshipGameInfo()
 
-#start_game()
-
 
 def cpu_loop():
-    game_log = BattleshipGameInfo()
\ No newline at end of file
+    game_log = BattleshipGameInfo()
+
+
+# Game starts only when run.py is executed, importing it has no side effects
+if __name__ == "__main__":
+    watch_terminal_size()
+    start_game()
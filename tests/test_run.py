@@ -0,0 +1,295 @@
+"""
+Checks for the cached and precomputed helpers of run.py.
+
+Run from the project root with:
+    python -m unittest discover tests
+"""
+import random
+import unittest
+from difflib import SequenceMatcher
+
+import run
+
+
+def reference_find_best_match(user_input, command_dict):
+    # The original matcher, every pass scans the whole dictionary
+    normalized_input = run.input_normalize_string(user_input)
+    unique_words = run.find_unique_words(command_dict)
+
+    if normalized_input in unique_words:
+        for key, values in command_dict.items():
+            for value in values:
+                if normalized_input in value:
+                    return [key]
+
+    for unique_word in unique_words:
+        if unique_word in normalized_input:
+            for key, values in command_dict.items():
+                for value in values:
+                    if unique_word in value:
+                        return [key]
+
+    partial_matches = [key for key, values in command_dict.items()
+                       if any(normalized_input in command
+                              for command in values)]
+    if partial_matches:
+        return partial_matches
+
+    max_ratio = 0
+    best_match = None
+    for key, values in command_dict.items():
+        for command in values:
+            ratio = SequenceMatcher(None, normalized_input,
+                                    run.input_normalize_string(command)
+                                    ).ratio()
+            if ratio > max_ratio:
+                max_ratio = ratio
+                best_match = key
+
+    return [best_match] if best_match else None
+
+
+def reference_search_pattern(map_game, height, width, symbol):
+    # Every window checked cell by cell
+    return [[row, col]
+            for row in range(len(map_game) - height + 1)
+            for col in range(len(map_game[0]) - width + 1)
+            if all(map_game[row + r][col + c] == symbol
+                   for r in range(height) for c in range(width))]
+
+
+def reference_find_biggest_ship_on_map(map_game, size, symbol):
+    # The original window search, shrinking from the biggest square
+    width = height = size * 2 - 1
+    while True:
+        coordinates_list = run.search_pattern(map_game, height, width, symbol)
+        if coordinates_list:
+            return run.get_coordinates_center(height, width, coordinates_list)
+        width -= 1
+        coordinates_list = run.search_pattern(map_game, height, width, symbol)
+        width_center_list = (run.get_coordinates_center(
+            height, width, coordinates_list) if coordinates_list else [])
+        width += 1
+        height -= 1
+        coordinates_list = run.search_pattern(map_game, height, width, symbol)
+        height_center_list = (run.get_coordinates_center(
+            height, width, coordinates_list) if coordinates_list else [])
+        center_list = width_center_list + height_center_list
+        if center_list:
+            return center_list
+        width -= 1
+        if width < size or height < size:
+            return []
+
+
+def random_map(rng, height, width, symbol, fill):
+    return [[symbol if rng.random() < fill else "S" for _ in range(width)]
+            for _ in range(height)]
+
+
+def typo_variants(rng, text, count):
+    variants = []
+    for _ in range(count):
+        letters = list(text)
+        letters[rng.randrange(len(letters))] = rng.choice(
+            "abcdefghijklmnopqrstuvwxyz")
+        variants.append("".join(letters))
+    return variants
+
+
+class TestSearchPattern(unittest.TestCase):
+
+    def test_matches_brute_force(self):
+        rng = random.Random(1)
+        for _ in range(150):
+            height, width = rng.randint(1, 9), rng.randint(1, 9)
+            map_game = random_map(rng, height, width, " ",
+                                  rng.choice((0.5, 0.8, 0.95)))
+            for pattern_height in range(1, height + 1):
+                for pattern_width in range(1, width + 1):
+                    self.assertEqual(
+                        run.search_pattern(map_game, pattern_height,
+                                           pattern_width, " "),
+                        reference_search_pattern(map_game, pattern_height,
+                                                 pattern_width, " "))
+
+    def test_updated_symbol_runs(self):
+        rng = random.Random(2)
+        map_game = random_map(rng, 8, 8, " ", 0.9)
+        symbol_runs = run.map_symbol_runs(map_game, " ")
+        map_game[3][2:6] = ["S"] * 4
+        run.map_symbol_runs(map_game, " ", symbol_runs, range(3, 4))
+        self.assertEqual(run.search_pattern(map_game, 2, 3, " ", symbol_runs),
+                         reference_search_pattern(map_game, 2, 3, " "))
+
+
+class TestLargestSquare(unittest.TestCase):
+
+    def test_matches_brute_force(self):
+        rng = random.Random(3)
+        for _ in range(200):
+            map_game = random_map(rng, rng.randint(1, 10), rng.randint(1, 10),
+                                  " ", rng.choice((0.5, 0.8, 0.95)))
+            side = max((side for side in range(1, min(len(map_game),
+                                                      len(map_game[0])) + 1)
+                        if reference_search_pattern(map_game, side, side,
+                                                    " ")), default=0)
+            self.assertEqual(run.map_largest_square(map_game, " "), side)
+
+    def test_biggest_ship_matches_window_search(self):
+        rng = random.Random(4)
+        for _ in range(300):
+            map_game = random_map(rng, rng.randint(3, 12), rng.randint(3, 12),
+                                  " ", rng.choice((0.6, 0.8, 0.95)))
+            size = rng.randint(1, 5)
+            self.assertEqual(
+                run.cpu_find_biggest_ship_on_map(map_game, size, " "),
+                reference_find_biggest_ship_on_map(map_game, size, " "))
+
+
+class TestFleet(unittest.TestCase):
+
+    def test_ships_stay_sorted_by_size(self):
+        fleet = run.create_fleet()
+        fleet.add_new_ship("Patrol", 2, 1)
+        fleet.add_new_ship("Giant", 6, 1)
+        sizes = [ship.size for ship in fleet.ships_by_size]
+        self.assertEqual(sizes, sorted(sizes, reverse=True))
+        self.assertEqual(fleet.get_biggest_ship_by_deployed_status().name,
+                         "Giant")
+
+    def test_ship_dictionary_follows_added_ships(self):
+        fleet = run.create_fleet()
+        ship_dictionary = fleet.ship_dictionary()
+        self.assertIs(fleet.ship_dictionary(), ship_dictionary)
+        self.assertNotIn("Patrol", ship_dictionary)
+
+        fleet.add_new_ship("Patrol", 2, 1)
+        self.assertIn("Patrol", fleet.ship_dictionary())
+        self.assertEqual(run.find_best_match("patrol",
+                                             fleet.ship_dictionary()),
+                         ["Patrol"])
+
+    def test_fleet_fits_map_follows_fleet_changes(self):
+        fleet = run.create_fleet()
+        self.assertTrue(run.fleet_fits_map_cached(fleet, 10, 10, True, " "))
+
+        fleet.add_new_ship("Giant", 11, 1)
+        self.assertFalse(run.fleet_fits_map_cached(fleet, 10, 10, True, " "))
+
+        fleet.remove_ships_by_name("Giant")
+        self.assertTrue(run.fleet_fits_map_cached(fleet, 10, 10, True, " "))
+
+    def test_clear_deployment(self):
+        fleet = run.create_fleet()
+        self.assertTrue(run.cpu_deploy_all_ships(run.create_map(10, 10, " "),
+                                                 fleet, True, " "))
+        self.assertIsNone(fleet.get_biggest_ship_by_deployed_status(False))
+
+        fleet.clear_deployment()
+        self.assertFalse(any(ship.deployed for ship in fleet.ships))
+        self.assertTrue(run.cpu_deploy_all_ships(run.create_map(10, 10, " "),
+                                                 fleet, True, " "))
+
+    def test_signature_follows_added_and_removed_ships(self):
+        fleet = run.create_fleet()
+        signature = fleet.signature()
+        self.assertIs(fleet.signature(), signature)
+
+        fleet.add_new_ship("Patrol", 2, 1)
+        self.assertNotEqual(fleet.signature(), signature)
+        self.assertIn(("Patrol", 2, 1), fleet.signature())
+
+        fleet.remove_ships_by_name("Patrol")
+        self.assertEqual(fleet.signature(), signature)
+
+
+class TestFleetTable(unittest.TestCase):
+
+    def expected_coordinates(self, settings, ships):
+        formatted = []
+        for ship in ships:
+            cells = []
+            for row, column in ship.cell_coordinates:
+                row_label = settings.row_labels[row]
+                col_label = settings.col_labels[column]
+                if settings.input_style[0] == "Row":
+                    cells.append(f"{row_label},{col_label}")
+                else:
+                    cells.append(f"{col_label},{row_label}")
+            formatted.append(" ".join(cells))
+        return formatted
+
+    def test_coordinates_condition(self):
+        settings = run.game_settings()
+        fleet = run.create_fleet()
+        self.assertTrue(run.cpu_deploy_all_ships(
+            run.create_map(settings.height, settings.width, settings.symbol),
+            fleet, settings.gaps, settings.symbol))
+
+        for input_style in (["Row", "Column"], ["Column", "Row"]):
+            settings.input_style = input_style
+            table = fleet.fleet_to_table(settings, ["deployed_coordinates"])
+            self.assertEqual(table[0][-1], "Deployed Coordinates")
+            for row in table[1:]:
+                self.assertEqual(row[-1], self.expected_coordinates(
+                    settings, fleet.ships_by_name[row[0]]))
+
+        # Moving a ship makes its cached text stale
+        ship = fleet.ships[0]
+        ship.set_cell_coordinates([(0, 0)])
+        table = fleet.fleet_to_table(settings, ["deployed_coordinates"])
+        row = next(row for row in table[1:] if row[0] == ship.name)
+        self.assertEqual(row[-1], self.expected_coordinates(
+            settings, fleet.ships_by_name[ship.name]))
+
+
+class TestCommandMatching(unittest.TestCase):
+
+    # Inputs that resolve the same way whatever order unique words come in
+    PINNED_COMMANDS = {
+        "start": ["start game"],
+        "begin game": ["start game"],
+        "gaps": ["gaps between ships"],
+        "ketween": ["gaps between ships"],
+        "distaxce": ["gaps between ships"],
+        "fleet lleet": ["print fleet"],
+        "swap input": ["change input"],
+        "default settings": ["reset settings"],
+    }
+
+    def test_pinned_commands(self):
+        for user_input, command in self.PINNED_COMMANDS.items():
+            self.assertEqual(run.find_best_command_match(user_input), command,
+                             user_input)
+
+    def test_matches_reference_for_commands(self):
+        rng = random.Random(5)
+        inputs = ["", "zzz", "add erase", "adjust ship spacing"]
+        for values in run.DICTIONARY_COMMANDS.values():
+            for value in values:
+                inputs.append(value)
+                inputs.extend(typo_variants(rng, value, 5))
+        for user_input in inputs:
+            self.assertEqual(run.find_best_command_match(user_input),
+                             reference_find_best_match(
+                                 user_input, run.DICTIONARY_COMMANDS),
+                             user_input)
+
+    def test_matches_reference_for_ships(self):
+        rng = random.Random(6)
+        ship_dictionary = run.create_ship_dictionary_from_fleet(
+            run.create_fleet())
+        inputs = []
+        for name in ship_dictionary:
+            inputs += [name, name.lower(), name[:3], name[1:]]
+            inputs.extend(typo_variants(rng, name, 5))
+        for user_input in inputs:
+            self.assertEqual(run.find_best_match(user_input, ship_dictionary),
+                             reference_find_best_match(user_input,
+                                                       ship_dictionary),
+                             user_input)
+
+
+if __name__ == "__main__":
+    unittest.main()